@@ -5,14 +5,22 @@
 
 import json
 import os
+import pickle
 from typing import Dict, Optional
 
 
 class AppConfig:
     """アプリケーション設定クラス"""
     
+    # JSON を読み込んだ結果を pickle で保存しておくキャッシュの形式バージョン
+    # （保持する項目を変えたら上げる。異なるバージョンのキャッシュは使わない）
+    CACHE_VERSION = 2
+    CACHE_FIELDS = ('co_point', 'race_folder', 'settings_folder',
+                    'status_map', 'final_status', 'penalty_map')
+    
     def __init__(self, config_file: str = "app_config.json"):
         self.config_file = config_file
+        self.cache_file = config_file + ".cache"
         self.co_point = 500  # CO 点数のデフォルト
         self.race_folder = "sample/race"
         self.settings_folder = "sample/setting"
@@ -26,6 +34,12 @@ class AppConfig:
         # ペナルティ: penalty_map[ゼッケン] = ペナルティ点数
         self.penalty_map: Dict[int, float] = {}
         
+        # 未保存の変更があるか（mark_dirty で立て、保存で下ろす）
+        self._dirty = False
+        
+        # 最後に保存した JSON 文字列（内容が変わっていなければ書き込みを省く）
+        self._last_saved_json = None
+        
         # 初期化時にファイルから読み込み
         self.load()
     
@@ -35,6 +49,10 @@ class AppConfig:
             # ファイルが存在しない場合はデフォルト値を使用
             return True
         
+        # 今の JSON から作ったキャッシュがあれば JSON の解析を省く
+        if self._load_cache():
+            return True
+        
         try:
             with open(self.config_file, 'r', encoding='utf-8') as f:
                 data = json.load(f)
@@ -60,6 +78,7 @@ class AppConfig:
             for zekken_str, penalty in penalty_map_data.items():
                 self.penalty_map[int(zekken_str)] = float(penalty)
             
+            self._save_cache()
             return True
         
         except Exception as e:
@@ -92,21 +111,89 @@ class AppConfig:
                 'penalty_map': penalty_map_data
             }
             
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            # 前回保存した内容から変わっていなければ書き込まない
+            serialized = json.dumps(data, ensure_ascii=False, indent=2)
+            if serialized == self._last_saved_json and os.path.exists(self.config_file):
+                self._dirty = False
+                return True
+            
+            # 一時ファイルに書いてから置き換え、書き込み途中の JSON が残らないようにする
+            tmp_file = self.config_file + ".tmp"
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                f.write(serialized)
+            os.replace(tmp_file, self.config_file)
             
+            self._last_saved_json = serialized
+            self._dirty = False
+            self._save_cache()
             return True
         
         except Exception as e:
             print(f"設定ファイル保存エラー: {e}")
             return False
     
+    def mark_dirty(self):
+        """未保存の変更があることを記録（保存は flush() でまとめて行う）"""
+        self._dirty = True
+    
+    def flush(self) -> bool:
+        """未保存の変更があれば保存"""
+        if not self._dirty:
+            return True
+        return self.save()
+    
+    def _load_cache(self) -> bool:
+        """キャッシュが現在の JSON から作られたものであれば読み込む
+        
+        キャッシュ作成時の JSON の更新時刻（ns）とサイズが現在の JSON と完全に一致する場合だけ使う。
+        更新時刻の前後だけで判定すると、展開・コピーで古い時刻のまま置かれた JSON よりキャッシュが優先されてしまう。
+        """
+        try:
+            with open(self.cache_file, 'rb') as f:
+                version, json_stamp, values = pickle.load(f)
+            if version != self.CACHE_VERSION:
+                return False
+            if json_stamp != self._get_json_stamp():
+                return False
+            
+            for name in self.CACHE_FIELDS:
+                setattr(self, name, values[name])
+            return True
+        
+        except Exception:
+            # キャッシュが無い・壊れている場合は JSON から読み込む
+            return False
+    
+    def _get_json_stamp(self) -> tuple:
+        """JSON ファイルの (更新時刻 ns, サイズ) を取得"""
+        stat = os.stat(self.config_file)
+        return stat.st_mtime_ns, stat.st_size
+    
+    def _save_cache(self):
+        """現在の設定をキャッシュに書き出す（一時ファイル経由で置き換え）"""
+        values = {name: getattr(self, name) for name in self.CACHE_FIELDS}
+        tmp_file = self.cache_file + ".tmp"
+        try:
+            # どの JSON から作ったキャッシュかを判定できるよう、JSON の更新時刻とサイズも保存する
+            json_stamp = self._get_json_stamp()
+            with open(tmp_file, 'wb') as f:
+                pickle.dump((self.CACHE_VERSION, json_stamp, values), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, self.cache_file)
+        except Exception as e:
+            # キャッシュは無くても動作するため、書けなくても処理は続ける
+            print(f"設定キャッシュ保存エラー: {e}")
+    
     def set_section_status(self, zekken: int, section: str, status: str):
         """区間のステータスを設定"""
         if zekken not in self.status_map:
             self.status_map[zekken] = {}
         self.status_map[zekken][section] = status
     
+    def set_section_statuses(self, statuses: Dict[int, Dict[str, str]]):
+        """区間のステータスをまとめて設定（statuses[ゼッケン][区間名] = ステータス）"""
+        for zekken, section_statuses in statuses.items():
+            self.status_map.setdefault(zekken, {}).update(section_statuses)
+    
     def get_section_status(self, zekken: int, section: str) -> Optional[str]:
         """区間のステータスを取得"""
         if zekken in self.status_map and section in self.status_map[zekken]:
@@ -4,6 +4,7 @@
 """
 
 from typing import Dict, List, Tuple, Optional
+import numpy as np
 from config_loader import ConfigLoader
 from race_parser import RaceParser
 
@@ -11,12 +12,17 @@ from race_parser import RaceParser
 class Result:
     """1つの区間の結果を保持するクラス"""
     
+    # 区間数×ゼッケン数だけ生成されるためインスタンス辞書を持たない
+    __slots__ = ('passage_time', 'diff', 'rank', 'point', 'status', 'passage_str', 'diff_str')
+    
     def __init__(self):
         self.passage_time: Optional[float] = None  # 通過時間（秒）
         self.diff: Optional[float] = None  # 差分（秒）
         self.rank: Optional[int] = None  # 順位
         self.point: int = 0  # 得点
         self.status: Optional[str] = None  # RIT, N.C., BLNK
+        self.passage_str: str = "ー"  # 通過時間の表示文字列（calculate_all で設定）
+        self.diff_str: str = "ー"  # 差分の表示文字列（calculate_all で設定）
         
 
 class CalculationEngine:
@@ -36,6 +42,19 @@ class CalculationEngine:
         
         # 最終結果ステータス: final_status[ゼッケン] = "RIT" or "N.C." or "BLNK"
         self.final_status: Dict[int, str] = {}
+        
+        # 計算結果の版数（calculate_all のたびに増加、表示側の再描画判定に使用）
+        self.version: int = 0
+        
+        # 区間別得点の集計用行列（calculate_all で作成）
+        # point_matrix[ゼッケンの行, 区間の列] = 得点
+        self.zekken_index: Dict[int, int] = {}
+        self.section_index: Dict[str, int] = {}
+        self.point_matrix = np.zeros((0, 0), dtype=np.int64)
+        # ゼッケンの行ごとの 係数・年齢係数 と、entries に登録されているか
+        self._coefs = np.zeros(0)
+        self._age_coefs = np.zeros(0)
+        self._has_entry = np.zeros(0, dtype=bool)
     
     def calculate_all(self):
         """すべての計算を実行"""
@@ -59,6 +78,34 @@ class CalculationEngine:
                 self._calculate_co(section_name)
             elif section_type == "PCG":
                 self._calculate_pcg(section_name)
+        
+        # 表示用文字列を一度だけフォーマットして結果に保持
+        for section_results in self.results.values():
+            for result in section_results.values():
+                result.passage_str = self.format_time(result.passage_time)
+                result.diff_str = self.format_diff(result.diff)
+        
+        self._build_point_matrix()
+        
+        self.version += 1
+    
+    def _build_point_matrix(self):
+        """区間別得点をゼッケン×区間の行列にまとめる（区間の組ごとの集計を一括で行うため）"""
+        self.zekken_index = {zekken: row for row, zekken in enumerate(self.results)}
+        self.section_index = {section: col for col, section in enumerate(self.config.get_section_order())}
+        
+        self.point_matrix = np.zeros((len(self.zekken_index), len(self.section_index)), dtype=np.int64)
+        for zekken, section_results in self.results.items():
+            row = self.zekken_index[zekken]
+            for section_name, result in section_results.items():
+                col = self.section_index.get(section_name)
+                if col is not None and result.point:
+                    self.point_matrix[row, col] = result.point
+        
+        entries = [self.config.entries_dict.get(zekken) for zekken in self.zekken_index]
+        self._coefs = np.array([e['Coef'] if e is not None else 0.0 for e in entries], dtype=float)
+        self._age_coefs = np.array([e['AgeCoef'] if e is not None else 0.0 for e in entries], dtype=float)
+        self._has_entry = np.array([e is not None for e in entries], dtype=bool)
     
     def _get_section_type(self, section_name: str) -> str:
         """区間名から競技タイプを取得"""
@@ -332,6 +379,38 @@ class CalculationEngine:
         total = int(pc_pcg_total * coef * age_coef + co_total)
         return total
     
+    def get_scores_for_sections(self, sections: List[str]) -> Dict[int, int]:
+        """指定された区間のみの得点を全ゼッケン分まとめて計算
+        
+        get_score_for_sections() と同じ計算を、得点行列の列和で一括して行う。
+        
+        Args:
+            sections: 区間名のリスト
+            
+        Returns:
+            {ゼッケン: 指定区間の総合得点}
+        """
+        pc_pcg_cols = []
+        co_cols = []
+        for section_name in sections:
+            col = self.section_index.get(section_name)
+            if col is None:
+                continue
+            section_type = self._get_section_type(section_name)
+            if section_type in ["PC", "PCG"]:
+                pc_pcg_cols.append(col)
+            elif section_type == "CO":
+                co_cols.append(col)
+        
+        pc_pcg_totals = self.point_matrix[:, pc_pcg_cols].sum(axis=1)
+        co_totals = self.point_matrix[:, co_cols].sum(axis=1)
+        
+        # int((PC + PCG) * 係数 * 年齢係数 + CO) と同じ順序で計算し、0方向に切り捨て
+        totals = pc_pcg_totals * self._coefs * self._age_coefs + co_totals
+        totals = np.where(self._has_entry, np.trunc(totals), 0).astype(np.int64)
+        
+        return dict(zip(self.zekken_index, totals.tolist()))
+    
     def format_time(self, seconds: Optional[float]) -> str:
         """秒を時刻文字列にフォーマット（HH:MM:SS.SS）"""
         if seconds is None:
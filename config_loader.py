@@ -17,6 +17,16 @@ class SectionInfo:
         self.GROUP = GROUP
 
 
+class StatusMatrix:
+    """ステータス設定・結果表示で共有する区間マトリックス情報を保持するクラス"""
+    def __init__(self, zekkens: List[int], sections: List[str],
+                 tabs: List[Tuple[str, List[str]]], by_group: bool):
+        self.zekkens = zekkens  # ゼッケン番号（昇順）
+        self.sections = sections  # section ファイルの並び順の区間名
+        self.tabs = tabs  # (タブ名, 区間名リスト) のリスト（日別、DAY列がなければグループ別）
+        self.by_group = by_group  # DAY列がなくGROUP列で代替した場合 True
+
+
 class ConfigLoader:
     """設定ファイル読み込みクラス"""
     
@@ -27,6 +37,8 @@ class ConfigLoader:
         self.section_dict = {}
         self.section_df = None
         self._section_list_cache = None
+        self._status_matrix_cache = None
+        self._sections_by_column_cache = {}  # 列名 → {番号: 区間名リスト}
     
     @property
     def section_list(self) -> List[SectionInfo]:
@@ -38,7 +50,9 @@ class ConfigLoader:
             return []
         
         sections = []
-        for _, row in self.section_df.iterrows():
+        columns = list(self.section_df.columns)
+        for values in self.section_df.itertuples(index=False, name=None):
+            row = dict(zip(columns, values))
             section_name = row.get('section', '')
             group = row.get('group', row.get('GROUP', None))
             sections.append(SectionInfo(
@@ -56,6 +70,9 @@ class ConfigLoader:
         Returns:
             (成功: bool, エラーメッセージ: str)
         """
+        self._status_matrix_cache = None
+        self._sections_by_column_cache = {}
+        
         # entries ファイル読み込み
         success, msg = self._load_entries()
         if not success:
@@ -107,8 +124,10 @@ class ConfigLoader:
             if missing_cols:
                 return False, f"entries ファイルに必須列が不足しています: {missing_cols}"
             
-            # ゼッケンごとに辞書作成
-            for _, row in df.iterrows():
+            # ゼッケンごとに辞書作成（行ごとに Series を作らず、タプルから列名 → 値の辞書を作る）
+            columns = list(df.columns)
+            for values in df.itertuples(index=False, name=None):
+                row = dict(zip(columns, values))
                 zekken = row['No']
                 if pd.isna(zekken) or zekken == 0:
                     continue
@@ -146,10 +165,8 @@ class ConfigLoader:
                 return False, f"point ファイルに必須列が不足しています: {missing_cols}"
             
             # 順位 → 得点の辞書作成
-            for _, row in df.iterrows():
-                order = int(row['Order'])
-                point = int(row['Point'])
-                self.point_dict[order] = point
+            for order, point in df[['Order', 'Point']].itertuples(index=False, name=None):
+                self.point_dict[int(order)] = int(point)
             
             return True, ""
         
@@ -178,23 +195,31 @@ class ConfigLoader:
             self.section_df = df
             
             # 区間名 → 設定タイムの辞書作成
-            for _, row in df.iterrows():
-                section_name = row['section']
-                time_sec = int(row['time'])
-                self.section_dict[section_name] = time_sec
+            for section_name, time_sec in df[['section', 'time']].itertuples(index=False, name=None):
+                self.section_dict[section_name] = int(time_sec)
             
             return True, ""
         
         except Exception as e:
             return False, f"section ファイル読み込みエラー: {str(e)}"
     
+    def _get_sections_by_column(self, column: str) -> Dict:
+        """指定列（GROUP/DAY）の値ごとの区間リストを一度だけ作成して返す"""
+        sections_by_value = self._sections_by_column_cache.get(column)
+        if sections_by_value is None:
+            sections_by_value = {
+                value: group_df['section'].tolist()
+                for value, group_df in self.section_df.groupby(column, sort=False)
+            }
+            self._sections_by_column_cache[column] = sections_by_value
+        return sections_by_value
+    
     def get_sections_by_group(self, group_num: int) -> list:
         """指定されたGROUP番号の区間リストを取得"""
         if self.section_df is None:
             return []
         
-        group_df = self.section_df[self.section_df['GROUP'] == group_num]
-        return group_df['section'].tolist()
+        return list(self._get_sections_by_column('GROUP').get(group_num, []))
     
     def get_sections_by_day(self, day_num: int) -> list:
         """指定されたDAY番号の区間リストを取得"""
@@ -204,8 +229,7 @@ class ConfigLoader:
         if not hasattr(self, 'has_day_column') or not self.has_day_column:
             return []
         
-        day_df = self.section_df[self.section_df['DAY'] == day_num]
-        return day_df['section'].tolist()
+        return list(self._get_sections_by_column('DAY').get(day_num, []))
     
     def get_max_day(self) -> int:
         """最大DAY番号を取得"""
@@ -215,10 +239,41 @@ class ConfigLoader:
         if not hasattr(self, 'has_day_column') or not self.has_day_column:
             return 0
         
-        return int(self.section_df['DAY'].max())
+        # DAY ごとの区間リスト（一度だけ作成）のキーから求め、列を走査し直さない
+        return int(max(self._get_sections_by_column('DAY'), default=0))
     
     def get_section_order(self) -> list:
         """section ファイルの並び順で区間名リストを取得"""
         if self.section_df is None:
             return []
         return self.section_df['section'].tolist()
+    
+    def build_status_matrix(self) -> StatusMatrix:
+        """ゼッケン・区間・日別タブ構成を一度だけ組み立てて返す（再読み込みまで使い回す）"""
+        if self._status_matrix_cache is not None:
+            return self._status_matrix_cache
+        
+        tabs = []
+        max_day = self.get_max_day()
+        if max_day > 0:
+            for day_idx in range(1, max_day + 1):
+                sections = self.get_sections_by_day(day_idx)
+                if sections:
+                    tabs.append((f"{day_idx}日目", sections))
+        else:
+            # DAY列がない場合、GROUP列で代替
+            for group_idx in range(1, 10):  # 最大10グループまで試す
+                sections = self.get_sections_by_group(group_idx)
+                if sections:
+                    tabs.append((f"グループ{group_idx}", sections))
+                elif group_idx > 1 and len(tabs) > 0:
+                    # 連続してセクションが見つからなくなったら終了
+                    break
+        
+        self._status_matrix_cache = StatusMatrix(
+            zekkens=sorted(self.entries_dict.keys()),
+            sections=self.get_section_order(),
+            tabs=tabs,
+            by_group=max_day <= 0
+        )
+        return self._status_matrix_cache
@@ -23,6 +23,9 @@ MAX_LOG_ITEMS = 10  # ログが長くなりすぎないように制限
 class ValidationError:
     """検証エラーを表すクラス"""
     
+    # 大量に生成されることがあるためインスタンス辞書を持たない
+    __slots__ = ('error_type', 'message', 'details', 'allow_confirmation', 'confirmed', '_comparison_key')
+    
     def __init__(self, error_type: str, message: str, details: Dict = None, allow_confirmation: bool = True):
         """
         Args:
@@ -36,8 +39,15 @@ class ValidationError:
         self.details = details or {}
         self.allow_confirmation = allow_confirmation
         self.confirmed = False
+        self._comparison_key = None  # get_comparison_key() の結果（初回呼び出し時に生成）
     
     def get_comparison_key(self) -> str:
+        """同一エラー判定用のキーを取得（生成は初回のみ）"""
+        if self._comparison_key is None:
+            self._comparison_key = self._build_comparison_key()
+        return self._comparison_key
+    
+    def _build_comparison_key(self) -> str:
         """同一エラー判定用のキーを生成"""
         if self.error_type == "csv_duplicate":
             # ファイル名重複: 区間名が同じ
@@ -112,6 +122,29 @@ def validate_all(race_folder: str, results: List, sections: List,
         sections: 区間設定のリスト
         calc_engine: 計算エンジン（計測データ不備チェックに使用、オプション）
         
+    Returns:
+        ValidationErrorのリスト
+    """
+    errors = validate_race_data(race_folder, results, sections)
+    
+    # 7. 計測データ不備確認（計算エンジンが利用可能な場合のみ）
+    if calc_engine:
+        errors.extend(validate_calculation(calc_engine, sections))
+    
+    return errors
+
+
+def validate_race_data(race_folder: str, results: List, sections: List) -> List[ValidationError]:
+    """
+    レースデータ（race フォルダと読み込み結果）に対する検証を実行（validate_all の 1〜6）
+    
+    計算結果に依存しないため、Race 読み込み時に一度だけ実行して結果を使い回せる。
+    
+    Args:
+        race_folder: レースデータフォルダのパス
+        results: レース結果のリスト
+        sections: 区間設定のリスト
+        
     Returns:
         ValidationErrorのリスト
     """
@@ -141,14 +174,24 @@ def validate_all(race_folder: str, results: List, sections: List,
     type_errors = check_measurement_type(race_folder)
     errors.extend(type_errors)
     
-    # 7. 計測データ不備確認（計算エンジンが利用可能な場合のみ）
-    if calc_engine:
-        deficiency_errors = check_measurement_deficiency(calc_engine, sections)
-        errors.extend(deficiency_errors)
-    
     return errors
 
 
+def validate_calculation(calc_engine, sections: List) -> List[ValidationError]:
+    """
+    計算結果に対する検証を実行（validate_all の 7）
+    
+    Args:
+        calc_engine: 計算エンジン
+        sections: 区間設定のリスト
+        
+    Returns:
+        ValidationErrorのリスト
+    """
+    # 7. 計測データ不備確認
+    return check_measurement_deficiency(calc_engine, sections)
+
+
 def check_duplicate_filenames(race_folder: str) -> List[ValidationError]:
     """
     CSVファイル名重複チェック
@@ -578,12 +621,8 @@ def check_measurement_type(race_folder: str) -> List[ValidationError]:
             
             section_name = ', '.join(sections) if sections else basename
             
-            # 各行をチェック
-            for idx, row in df.iterrows():
-                type_val = row[type_col]
-                time_val = row[time_col]
-                number_val = row[number_col]
-                
+            # 各行をチェック（行ごとに Series を作らないよう、必要な 3 列だけをタプルで走査）
+            for type_val, time_val, number_val in df[[type_col, time_col, number_col]].itertuples(index=False, name=None):
                 # type=Tかつnumberが入力されている場合
                 if pd.notna(type_val) and str(type_val).strip().upper() == 'T':
                     if pd.notna(number_val) and str(number_val).strip() != '':
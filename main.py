@@ -488,9 +488,9 @@ class MainWindow:
             self.summary_text.insert(tk.END, "-" * 60 + "\n")
             
             for _, row in summary_df.iterrows():
-                rank = row['順位']
-                zekken = row['ゼッケン']
-                score = row['総合得点']
+                rank = row['Result']
+                zekken = row['No']
+                score = row['TotalPoint']
                 
                 if isinstance(rank, str):
                     # ステータス（RIT/N.C./BLNK）
@@ -4,17 +4,22 @@ PySide6 を使った高機能 GUI アプリケーション
 """
 
 import sys
+import math
+import numpy as np
 import pandas as pd
 from typing import List
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QTableWidget, QTableWidgetItem, QPushButton, QTabWidget,
+    QTableWidget, QTableWidgetItem, QTableView, QPushButton, QTabWidget,
     QLabel, QMessageBox, QFileDialog, QDialog, QFormLayout,
     QLineEdit, QComboBox, QScrollArea, QHeaderView, QStyle, QSplitter,
-    QAbstractItemView, QGridLayout
+    QAbstractItemView, QGridLayout, QInputDialog, QPlainTextEdit, QButtonGroup, QCompleter
 )
-from PySide6.QtCore import Qt, QSize
-from PySide6.QtGui import QColor, QBrush, QFont, QAction
+from PySide6.QtCore import (
+    Qt, QSize, QAbstractTableModel, QModelIndex, QObject, QRunnable, QThreadPool, QTimer, Signal,
+    QSortFilterProxyModel, QStringListModel, QSignalBlocker
+)
+from PySide6.QtGui import QColor, QBrush, QFont, QFontDatabase, QAction, QIntValidator
 
 from config_loader import ConfigLoader
 from race_parser import RaceParser
@@ -23,22 +28,49 @@ from output_formatter import OutputFormatter
 from app_config import AppConfig
 from logging_config import init_app_logging, get_logger
 from sample_generator import generate_sample_files
-from data_validator import validate_all, ValidationError
+from data_validator import validate_race_data, validate_calculation, ValidationError
 
 # ロギング初期化
 init_app_logging()
 logger = get_logger(__name__)
 
 
+class _CenteredItem(QTableWidgetItem):
+    """中央揃えを設定済みのテーブルセル"""
+    
+    def __init__(self, text=""):
+        super().__init__(text)
+        self.setTextAlignment(Qt.AlignCenter)
+
+
 class ErrorDialog(QDialog):
     """エラー確認ダイアログ"""
     
+    # ステータス列の背景色
+    CONFIRMED_BRUSH = QBrush(QColor(200, 255, 200))  # 緑
+    UNCONFIRMED_BRUSH = QBrush(QColor(255, 200, 200))  # 赤
+    
+    # エラー種別の表示名
+    ERROR_TYPE_NAMES = {
+        "csv_duplicate": "CSVファイル名重複",
+        "zekken_duplicate": "ゼッケン重複",
+        "section_order": "区間通過順",
+        "zekken_order": "ゼッケン通過順",
+        "invalid_status": "ステータス不正",
+        "measurement_type": "計測タイプ",
+        "measurement_deficiency": "計測データ不備"
+    }
+    
     def __init__(self, parent, errors: List[ValidationError]):
         super().__init__(parent)
         self.errors = errors
         self.setWindowTitle("エラー確認")
         self.setMinimumSize(800, 600)
         
+        # 件数はここで一度だけ数え、以降は確認状態の変更に合わせて増減させる
+        self._confirmable_total = sum(1 for err in errors if err.allow_confirmation)
+        self._unconfirmed_count = sum(1 for err in errors if not err.confirmed)
+        
         self._create_widgets()
     
     def _create_widgets(self):
@@ -88,44 +120,53 @@ class ErrorDialog(QDialog):
         self.setLayout(layout)
     
     def _populate_errors(self):
-        """エラーをテーブルに表示"""
+        """エラーをテーブルに表示（ダイアログ生成時に一度だけ）"""
         self.error_table.setRowCount(len(self.errors))
         
+        # 編集不可のセルのプロトタイプ（フラグ設定済み、clone() で複製して使う）
+        prototype = QTableWidgetItem()
+        prototype.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
+        
         for row, error in enumerate(self.errors):
             # ステータス列
-            status_item = QTableWidgetItem()
-            if error.confirmed:
-                status_item.setText("✓ 確認済み")
-                status_item.setBackground(QBrush(QColor(200, 255, 200)))  # 緑
-            else:
-                status_item.setText("未確認")
-                status_item.setBackground(QBrush(QColor(255, 200, 200)))  # 赤
-            status_item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
+            status_item = prototype.clone()
+            self._set_status_item(status_item, error.confirmed)
             self.error_table.setItem(row, 0, status_item)
             
             # エラー種別列
-            type_names = {
-                "csv_duplicate": "CSVファイル名重複",
-                "zekken_duplicate": "ゼッケン重複",
-                "section_order": "区間通過順",
-                "zekken_order": "ゼッケン通過順",
-                "invalid_status": "ステータス不正",
-                "measurement_type": "計測タイプ",
-                "measurement_deficiency": "計測データ不備"
-            }
-            type_item = QTableWidgetItem(type_names.get(error.error_type, error.error_type))
-            type_item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
+            type_item = prototype.clone()
+            type_item.setText(self.ERROR_TYPE_NAMES.get(error.error_type, error.error_type))
             self.error_table.setItem(row, 1, type_item)
             
             # 詳細列
-            detail_item = QTableWidgetItem(error.message)
-            detail_item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
+            detail_item = prototype.clone()
+            detail_item.setText(error.message)
             self.error_table.setItem(row, 2, detail_item)
         
         # 列幅を調整
         self.error_table.setColumnWidth(0, 100)
         self.error_table.setColumnWidth(1, 150)
     
+    def _set_status_item(self, status_item, confirmed):
+        """ステータス列のセルに確認状態を反映"""
+        if confirmed:
+            status_item.setText("✓ 確認済み")
+            status_item.setBackground(self.CONFIRMED_BRUSH)
+        else:
+            status_item.setText("未確認")
+            status_item.setBackground(self.UNCONFIRMED_BRUSH)
+    
+    def _update_status_rows(self, rows):
+        """指定行のステータス列だけを書き換える（セルは作り直さない）"""
+        self.error_table.setUpdatesEnabled(False)
+        self.error_table.blockSignals(True)
+        try:
+            for row in rows:
+                self._set_status_item(self.error_table.item(row, 0), self.errors[row].confirmed)
+        finally:
+            self.error_table.blockSignals(False)
+            self.error_table.setUpdatesEnabled(True)
+    
     def _confirm_selected_error(self):
         """選択したエラーを確認済みにする"""
         selected_rows = self.error_table.selectionModel().selectedRows()
@@ -147,15 +188,17 @@ class ErrorDialog(QDialog):
             return
         
         # 確認済みに変更
-        error.confirmed = True
-        self._populate_errors()
+        if not error.confirmed:
+            error.confirmed = True
+            self._unconfirmed_count -= 1
+        self._update_status_rows([row])
         QMessageBox.information(self, "成功", "エラーを確認済みにしました。")
     
     def _confirm_all_errors(self):
         """すべてのエラーを確認済みにする（許容されるもののみ）"""
         # 確認できないエラーをカウント
-        non_confirmable = sum(1 for err in self.errors if not err.allow_confirmation)
-        confirmable = sum(1 for err in self.errors if err.allow_confirmation)
+        confirmable = self._confirmable_total
+        non_confirmable = len(self.errors) - confirmable
         
         if non_confirmable > 0:
             reply = QMessageBox.question(
@@ -180,12 +223,15 @@ class ErrorDialog(QDialog):
             if reply == QMessageBox.No:
                 return
         
-        # すべての確認可能なエラーを確認済みにする
-        for error in self.errors:
-            if error.allow_confirmation:
+        # すべての確認可能なエラーを確認済みにする（状態が変わった行だけ更新）
+        changed_rows = []
+        for row, error in enumerate(self.errors):
+            if error.allow_confirmation and not error.confirmed:
                 error.confirmed = True
+                changed_rows.append(row)
+        self._unconfirmed_count -= len(changed_rows)
         
-        self._populate_errors()
+        self._update_status_rows(changed_rows)
         QMessageBox.information(self, "成功", f"{confirmable}件のエラーを確認済みにしました。")
     
     def _unconfirm_selected_error(self):
@@ -199,27 +245,34 @@ class ErrorDialog(QDialog):
         error = self.errors[row]
         
         # 未確認に戻す
-        error.confirmed = False
-        self._populate_errors()
+        if error.confirmed:
+            error.confirmed = False
+            self._unconfirmed_count += 1
+        self._update_status_rows([row])
         QMessageBox.information(self, "成功", "エラーを未確認に戻しました。")
     
     def get_unconfirmed_count(self) -> int:
         """未確認エラーの数を取得"""
-        return sum(1 for error in self.errors if not error.confirmed)
+        return self._unconfirmed_count
 
 
 class StatusMatrixDialog(QDialog):
     """区間ステータス設定ダイアログ（フィルター・タブ対応版）"""
     
-    def __init__(self, parent, app_config, config_loader):
+    def __init__(self, parent, app_config, config_loader, status_matrix=None):
         super().__init__(parent)
         self.app_config = app_config
         self.config_loader = config_loader
         self.setWindowTitle("区間ステータス設定")
         self.setMinimumSize(1200, 700)
         
-        self.all_zekkens = sorted(config_loader.entries_dict.keys())
-        self.all_sections = config_loader.get_section_order()
+        # ゼッケン・区間・タブ構成は config_loader 読み込み時に組み立てたものを共有
+        self.status_matrix = status_matrix or config_loader.build_status_matrix()
+        self.all_zekkens = self.status_matrix.zekkens
+        self.all_zekkens_set = set(self.all_zekkens)  # フィルター入力の照合用
+        self.all_sections = self.status_matrix.sections
+        # フィルター入力の補完候補（全入力欄で共有）
+        self.zekken_completion_model = QStringListModel([str(zekken) for zekken in self.all_zekkens], self)
         self.status_options = ["", "RIT", "N.C.", "BLNK"]
         
         # 現在選択されているステータス
@@ -248,17 +301,22 @@ class StatusMatrixDialog(QDialog):
         button_layout = QHBoxLayout()
         button_layout.addWidget(QLabel("ステータス選択:"))
         
+        # 排他グループで単一選択を Qt に任せる（ID は status_options のインデックス）
         self.status_buttons = {}
-        for status in self.status_options:
+        self.status_button_group = QButtonGroup(self)
+        self.status_button_group.setExclusive(True)
+        for status_idx, status in enumerate(self.status_options):
             btn_text = "空白" if status == "" else status
             btn = QPushButton(btn_text)
             btn.setCheckable(True)
             btn.setMinimumWidth(80)
             if status == "":
                 btn.setChecked(True)
-            btn.clicked.connect(lambda checked, s=status: self._on_status_selected(s))
             self.status_buttons[status] = btn
+            self.status_button_group.addButton(btn, status_idx)
             button_layout.addWidget(btn)
+        self.status_button_group.idClicked.connect(
+            lambda status_idx: self._on_status_selected(self.status_options[status_idx]))
         
         button_layout.addStretch()
         top_layout.addLayout(button_layout)
@@ -312,25 +370,11 @@ class StatusMatrixDialog(QDialog):
         self.tab_widgets.append(all_day_widget)
         self.tab_widget.addTab(all_day_widget, "全日")
         
-        # 日別タブを動的に生成
-        max_day = self.config_loader.get_max_day()
-        if max_day > 0:
-            for day_idx in range(1, max_day + 1):
-                sections = self.config_loader.get_sections_by_day(day_idx)
-                if sections:
-                    day_widget = StatusMatrixTabWidget(self, self.all_zekkens, sections)
-                    self.tab_widgets.append(day_widget)
-                    self.tab_widget.addTab(day_widget, f"{day_idx}日目")
-        else:
-            # DAY列がない場合、GROUP列で代替
-            for group_idx in range(1, 10):
-                sections = self.config_loader.get_sections_by_group(group_idx)
-                if sections:
-                    group_widget = StatusMatrixTabWidget(self, self.all_zekkens, sections)
-                    self.tab_widgets.append(group_widget)
-                    self.tab_widget.addTab(group_widget, f"グループ{group_idx}")
-                elif group_idx > 1 and len(self.tab_widgets) > 1:
-                    break
+        # 日別タブを動的に生成（DAY列がない場合はグループ別）
+        for title, sections in self.status_matrix.tabs:
+            day_widget = StatusMatrixTabWidget(self, self.all_zekkens, sections)
+            self.tab_widgets.append(day_widget)
+            self.tab_widget.addTab(day_widget, title)
         
         # タブウィジェットを追加（stretch=8で画面の約80%を確保）
         # 上部のフィルター部分が20%程度を占めるため、残りの80%をテーブル表示に割り当て
@@ -365,6 +409,10 @@ class StatusMatrixDialog(QDialog):
         zekken_input = QLineEdit()
         zekken_input.setPlaceholderText("ゼッケン番号")
         zekken_input.setMaximumWidth(80)
+        zekken_input.setValidator(QIntValidator(0, max(self.all_zekkens, default=0), zekken_input))
+        completer = QCompleter(self.zekken_completion_model, zekken_input)
+        completer.setCompletionMode(QCompleter.PopupCompletion)
+        zekken_input.setCompleter(completer)
         condition_layout.addWidget(zekken_input)
         
         remove_btn = QPushButton("×")
@@ -392,13 +440,18 @@ class StatusMatrixDialog(QDialog):
         filtered_zekkens = []
         for input_widget in self.filter_conditions:
             text = input_widget.text().strip()
-            if text:
+            if not text:
+                continue
+            # 数字のみの入力（通常のケース）は例外処理を通さずに変換
+            if text.isdecimal():
+                zekken = int(text)
+            else:
                 try:
                     zekken = int(text)
-                    if zekken in self.all_zekkens:
-                        filtered_zekkens.append(zekken)
                 except ValueError:
-                    pass
+                    continue
+            if zekken in self.all_zekkens_set:
+                filtered_zekkens.append(zekken)
         
         if filtered_zekkens:
             self.filter_active = True
@@ -418,8 +471,7 @@ class StatusMatrixDialog(QDialog):
     
     def _on_status_selected(self, status):
         """ステータスボタンが選択された時"""
-        for s, btn in self.status_buttons.items():
-            btn.setChecked(s == status)
+        self.status_buttons[status].setChecked(True)
         
         self.current_status = status
         # 全タブに現在のステータスを伝播
@@ -431,6 +483,19 @@ class StatusMatrixDialog(QDialog):
         for tab_widget in self.tab_widgets:
             tab_widget.load_current_status(self.app_config)
     
+    def reload(self, app_config):
+        """ウィジェットを作り直さずに、開き直したときの状態へ戻す"""
+        self.app_config = app_config
+        
+        # フィルター条件を破棄して全表示に戻す
+        for input_widget in list(self.filter_conditions):
+            self._remove_filter_condition(input_widget.parentWidget())
+        self._show_all()
+        
+        self._on_status_selected("")
+        self.tab_widget.setCurrentIndex(0)
+        self._load_current_status()
+    
     def _save(self):
         """ステータスを保存"""
         self.app_config.status_map = {}
@@ -451,13 +516,230 @@ class StatusMatrixDialog(QDialog):
                 tab_widget.clear_all()
 
 
-class StatusMatrixTabWidget(QWidget):
-    """ステータスマトリックスの1つのタブ"""
+class StatusMatrixModel(QAbstractTableModel):
+    """ステータスマトリックスのモデル
+    
+    入力済みのセルだけを (行, 列) → 表示文字列 の辞書で保持し、セルの内容は表示時に data() で生成する。
+    QTableWidgetItem をセルごとに作成しないため、大量のエントリーでも軽量に動作する。
+    """
     
     # ステータスと省略形の対応マップ
     STATUS_ABBREV_MAP = {"RIT": "R", "N.C.": "N", "BLNK": "B", "": ""}
     ABBREV_STATUS_MAP = {"R": "RIT", "N": "N.C.", "B": "BLNK", "": ""}
     
+    # ステータス別の背景色
+    STATUS_BRUSHES = {
+        "": QBrush(Qt.white),
+        "RIT": QBrush(QColor(255, 200, 200)),
+        "N.C.": QBrush(QColor(255, 255, 200)),
+        "BLNK": QBrush(QColor(200, 200, 255)),
+    }
+    ZEKKEN_BRUSH = QBrush(QColor(240, 240, 240))
+    PENALTY_BRUSH = QBrush(QColor(255, 250, 205))  # 淡い黄色で区別
+    TEXT_BRUSH = QBrush(Qt.black)  # 黒文字
+    
+    def __init__(self, zekkens, sections, parent=None):
+        super().__init__(parent)
+        self.zekkens = zekkens
+        self.sections = sections
+        # 列: ゼッケン + 区間 + ペナルティ + Total Result
+        self.headers = ["ゼッケン"] + sections + ["ペナルティ", "Total Result"]
+        self.penalty_col = len(sections) + 1
+        self.total_result_col = len(sections) + 2
+        # 空でないセルのみ保持: cell_texts[(行, 列)] = 表示文字列
+        self.cell_texts = {}
+    
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.zekkens)
+    
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.headers)
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.headers[section]
+        return super().headerData(section, orientation, role)
+    
+    def flags(self, index):
+        if index.column() == 0:
+            return Qt.ItemIsEnabled
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsEditable
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        row, col = index.row(), index.column()
+        
+        # ゼッケン列
+        if col == 0:
+            if role == Qt.DisplayRole:
+                return str(self.zekkens[row])
+            if role == Qt.ForegroundRole:
+                return self.TEXT_BRUSH
+            if role == Qt.BackgroundRole:
+                return self.ZEKKEN_BRUSH
+            return None
+        
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            return self.cell_texts.get((row, col), "")
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        
+        # ペナルティ列（数字入力）
+        if col == self.penalty_col:
+            if role == Qt.ForegroundRole:
+                return self.TEXT_BRUSH
+            if role == Qt.BackgroundRole:
+                return self.PENALTY_BRUSH
+            return None
+        
+        # 区間ステータス / Total Result 列
+        if role == Qt.BackgroundRole:
+            status = self._abbrev_to_status(self.cell_texts.get((row, col), ""))
+            return self.STATUS_BRUSHES.get(status, self.STATUS_BRUSHES[""])
+        return None
+    
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or index.column() == 0 or role != Qt.EditRole:
+            return False
+        
+        self._set_text(index.row(), index.column(), str(value))
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole, Qt.BackgroundRole])
+        return True
+    
+    def _status_to_abbrev(self, status):
+        """ステータスを省略形に変換"""
+        return self.STATUS_ABBREV_MAP.get(status, status)
+    
+    def _abbrev_to_status(self, abbrev):
+        """省略形をステータスに変換"""
+        return self.ABBREV_STATUS_MAP.get(abbrev, abbrev)
+    
+    def _set_text(self, row, col, text):
+        """セルの表示文字列を設定（空文字は辞書から削除）"""
+        if text:
+            self.cell_texts[(row, col)] = text
+        else:
+            self.cell_texts.pop((row, col), None)
+    
+    def set_status(self, indexes, status):
+        """指定セルにステータスを適用し、変更範囲をまとめて再描画"""
+        abbrev = self._status_to_abbrev(status)
+        
+        # 既に同じステータスのセルは書き換えず、再描画範囲にも含めない
+        rows = []
+        cols = []
+        for index in indexes:
+            row, col = index.row(), index.column()
+            if self.cell_texts.get((row, col), "") == abbrev:
+                continue
+            self._set_text(row, col, abbrev)
+            rows.append(row)
+            cols.append(col)
+        
+        if not rows:
+            return
+        
+        self.dataChanged.emit(
+            self.index(min(rows), min(cols)), self.index(max(rows), max(cols)),
+            [Qt.DisplayRole, Qt.EditRole, Qt.BackgroundRole]
+        )
+    
+    def load_status(self, app_config):
+        """現在のステータス設定を読み込む（設定済みのセルだけをたどる）"""
+        self.beginResetModel()
+        self.cell_texts = {}
+        row_of = {zekken: row_idx for row_idx, zekken in enumerate(self.zekkens)}
+        col_of = {section: col_idx for col_idx, section in enumerate(self.sections, start=1)}
+        
+        # 区間ステータス
+        for zekken, section_statuses in app_config.status_map.items():
+            row_idx = row_of.get(zekken)
+            if row_idx is None:
+                continue
+            for section, status in section_statuses.items():
+                col_idx = col_of.get(section)
+                if col_idx is not None:
+                    self._set_text(row_idx, col_idx, self._status_to_abbrev(status or ""))
+        
+        # Total Result ステータス
+        for zekken, status in app_config.final_status.items():
+            row_idx = row_of.get(zekken)
+            if row_idx is not None:
+                self._set_text(row_idx, self.total_result_col, self._status_to_abbrev(status or ""))
+        
+        # ペナルティ
+        for zekken, penalty in app_config.penalty_map.items():
+            row_idx = row_of.get(zekken)
+            if row_idx is not None and penalty != 0.0:
+                self._set_text(row_idx, self.penalty_col, str(penalty))
+        self.endResetModel()
+    
+    def save_status(self, app_config):
+        """ステータスを保存（手元の辞書に集めてから設定へまとめて反映）"""
+        section_statuses = {}
+        final_statuses = {}
+        penalties = {}
+        for (row_idx, col_idx), text in sorted(self.cell_texts.items()):
+            zekken = self.zekkens[row_idx]
+            
+            # ペナルティ
+            if col_idx == self.penalty_col:
+                penalty_text = text.strip()
+                if penalty_text:
+                    try:
+                        penalties[zekken] = float(penalty_text)
+                    except ValueError:
+                        pass  # 無効な数字は無視
+                continue
+            
+            status = self._abbrev_to_status(text)
+            if not status:
+                continue
+            if col_idx == self.total_result_col:
+                # Total Result ステータス
+                final_statuses[zekken] = status
+            else:
+                # 区間ステータス
+                section_statuses.setdefault(zekken, {})[self.sections[col_idx - 1]] = status
+        
+        app_config.set_section_statuses(section_statuses)
+        app_config.final_status.update(final_statuses)
+        app_config.penalty_map.update(penalties)
+    
+    def clear_all(self):
+        """すべてクリア"""
+        self.beginResetModel()
+        self.cell_texts = {}
+        self.endResetModel()
+
+
+class ZekkenFilterProxyModel(QSortFilterProxyModel):
+    """ゼッケン番号の集合で行を絞り込むプロキシモデル"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.zekken_filter = None  # Noneは全表示
+    
+    def set_zekken_filter(self, zekkens):
+        """表示するゼッケン番号を設定（None で全表示）"""
+        self.zekken_filter = None if zekkens is None else set(zekkens)
+        self.invalidateFilter()
+    
+    def filterAcceptsRow(self, source_row, source_parent):
+        if self.zekken_filter is None:
+            return True
+        return self.sourceModel().zekkens[source_row] in self.zekken_filter
+
+
+class StatusMatrixTabWidget(QWidget):
+    """ステータスマトリックスの1つのタブ"""
+    
     # 列幅定数
     ZEKKEN_COLUMN_WIDTH = 40
     SECTION_COLUMN_WIDTH = 30
@@ -474,14 +756,6 @@ class StatusMatrixTabWidget(QWidget):
         
         self._create_widgets()
     
-    def _status_to_abbrev(self, status):
-        """ステータスを省略形に変換"""
-        return self.STATUS_ABBREV_MAP.get(status, status)
-    
-    def _abbrev_to_status(self, abbrev):
-        """省略形をステータスに変換"""
-        return self.ABBREV_STATUS_MAP.get(abbrev, abbrev)
-    
     def _create_widgets(self):
         layout = QVBoxLayout()
         
@@ -489,64 +763,38 @@ class StatusMatrixTabWidget(QWidget):
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
         
+        # モデル（ゼッケン番号でフィルターするプロキシを挟む）
+        self.model = StatusMatrixModel(self.all_zekkens, self.sections, self)
+        self.proxy_model = ZekkenFilterProxyModel(self)
+        self.proxy_model.setSourceModel(self.model)
+        
+        # ペナルティ列とTotal Result列のインデックスを記憶
+        self.penalty_col = self.model.penalty_col
+        self.total_result_col = self.model.total_result_col
+        
         # テーブル
-        self.table = QTableWidget()
-        self.table.setRowCount(len(self.all_zekkens))
-        # 列数: ゼッケン + 区間 + Total Result + Penalty
-        self.table.setColumnCount(len(self.sections) + 3)
+        self.table = QTableView()
+        self.table.setModel(self.proxy_model)
         
         # 複数セル選択を有効化
-        self.table.setSelectionMode(QTableWidget.MultiSelection)
+        self.table.setSelectionMode(QAbstractItemView.MultiSelection)
         
         # セルクリック/変更イベント
-        self.table.itemClicked.connect(self._on_cell_clicked)
-        self.table.itemSelectionChanged.connect(self._on_selection_changed)
-        
-        # ヘッダー
-        headers = ["ゼッケン"] + self.sections + ["ペナルティ", "Total Result"]
-        self.table.setHorizontalHeaderLabels(headers)
-        
-        # ペナルティ列とTotal Result列のインデックスを記憶
-        self.penalty_col = len(self.sections) + 1
-        self.total_result_col = len(self.sections) + 2
+        # ドラッグ中は選択変更が連続して届くため、イベントループに戻ったときに一度だけ適用する
+        self._selection_timer = QTimer(self)
+        self._selection_timer.setSingleShot(True)
+        self._selection_timer.setInterval(0)
+        self._selection_timer.timeout.connect(self._apply_status_to_selection)
+        self.table.clicked.connect(self._on_cell_clicked)
+        self.table.selectionModel().selectionChanged.connect(self._on_selection_changed)
         
         # 列幅を設定（可読性向上のため半分に縮小）
+        # 区間列は既定幅で揃え、幅の異なる列だけ個別に指定する
+        self.table.horizontalHeader().setDefaultSectionSize(self.SECTION_COLUMN_WIDTH)
         self.table.setColumnWidth(0, self.ZEKKEN_COLUMN_WIDTH)
-        for col_idx in range(1, len(self.sections) + 1):
-            self.table.setColumnWidth(col_idx, self.SECTION_COLUMN_WIDTH)
         self.table.setColumnWidth(self.penalty_col, self.PENALTY_COLUMN_WIDTH)
         self.table.setColumnWidth(self.total_result_col, self.TOTAL_RESULT_COLUMN_WIDTH)
         
-        # データ入力
-        for row_idx, zekken in enumerate(self.all_zekkens):
-            # ゼッケン列
-            item = QTableWidgetItem(str(zekken))
-            item.setFlags(Qt.ItemIsEnabled)
-            item.setBackground(QBrush(QColor(240, 240, 240)))
-            item.setForeground(QBrush(QColor(0, 0, 0)))  # 黒文字
-            self.table.setItem(row_idx, 0, item)
-            
-            # 各区間のセル
-            for col_idx, section in enumerate(self.sections, start=1):
-                item = QTableWidgetItem("")
-                item.setTextAlignment(Qt.AlignCenter)
-                item.setData(Qt.UserRole, (zekken, section))
-                self.table.setItem(row_idx, col_idx, item)
-            
-            # ペナルティ列（数字入力）
-            penalty_item = QTableWidgetItem("")
-            penalty_item.setTextAlignment(Qt.AlignCenter)
-            penalty_item.setData(Qt.UserRole, ("penalty", zekken))
-            penalty_item.setBackground(QBrush(QColor(255, 250, 205)))  # 淡い黄色で区別
-            penalty_item.setForeground(QBrush(QColor(0, 0, 0)))  # 黒文字
-            self.table.setItem(row_idx, self.penalty_col, penalty_item)
-            
-            # Total Result列（ステータス入力）
-            total_result_item = QTableWidgetItem("")
-            total_result_item.setTextAlignment(Qt.AlignCenter)
-            total_result_item.setData(Qt.UserRole, ("total_result", zekken))
-            self.table.setItem(row_idx, self.total_result_col, total_result_item)
-        
         scroll.setWidget(self.table)
         layout.addWidget(scroll)
         
@@ -564,134 +812,69 @@ class StatusMatrixTabWidget(QWidget):
     
     def _update_row_visibility(self):
         """行の表示/非表示を更新"""
-        for row_idx, zekken in enumerate(self.all_zekkens):
-            if self.filtered_zekkens is None:
-                self.table.setRowHidden(row_idx, False)
-            else:
-                self.table.setRowHidden(row_idx, zekken not in self.filtered_zekkens)
+        self.proxy_model.set_zekken_filter(self.filtered_zekkens)
     
-    def _on_cell_clicked(self, item):
+    def _on_cell_clicked(self, index):
         """セルがクリックされた時"""
-        if item.column() == 0:  # ゼッケン列
-            return
-        
-        col = item.column()
+        col = index.column()
         
-        # ペナルティ列は数字入力なので、クリックでステータスを適用しない
-        if col == self.penalty_col:
+        # ゼッケン列、およびペナルティ列（数字入力）はクリックでステータスを適用しない
+        if col == 0 or col == self.penalty_col:
             return
         
         # 区間ステータスまたはTotal Result列の場合、ステータスを適用
-        if col <= len(self.sections) or col == self.total_result_col:
-            self._apply_status_to_item(item)
-    
-    def _on_selection_changed(self):
-        """選択が変更された時（ドラッグ選択）"""
-        selected_items = self.table.selectedItems()
-        for item in selected_items:
-            col = item.column()
-            # ゼッケン列とペナルティ列以外にステータスを適用
-            if col > 0 and col != self.penalty_col:
-                self._apply_status_to_item(item)
-    
-    def _apply_status_to_item(self, item):
-        """アイテムにステータスを適用"""
-        abbrev = self._status_to_abbrev(self.current_status)
-        item.setText(abbrev)
-        self._update_cell_color(item, self.current_status)
-    
-    def _update_cell_color(self, item, status):
-        """ステータスに応じてセルの色を変更"""
-        if status == "":
-            item.setBackground(QBrush(QColor(255, 255, 255)))
-        elif status == "RIT":
-            item.setBackground(QBrush(QColor(255, 200, 200)))
-        elif status == "N.C.":
-            item.setBackground(QBrush(QColor(255, 255, 200)))
-        elif status == "BLNK":
-            item.setBackground(QBrush(QColor(200, 200, 255)))
+        self._apply_status_to_indexes([index])
+    
+    def _on_selection_changed(self, selected=None, deselected=None):
+        """選択が変更された時（ドラッグ選択）: 適用は _apply_status_to_selection にまとめる"""
+        self._selection_timer.start()
+    
+    def _apply_status_to_selection(self):
+        """選択中のセルにステータスを適用"""
+        # ゼッケン列とペナルティ列以外にステータスを適用
+        indexes = [
+            index for index in self.table.selectionModel().selectedIndexes()
+            if index.column() > 0 and index.column() != self.penalty_col
+        ]
+        self._apply_status_to_indexes(indexes)
+    
+    def _apply_status_to_indexes(self, indexes):
+        """セル（プロキシ側のインデックス）にステータスを適用"""
+        source_indexes = [self.proxy_model.mapToSource(index) for index in indexes]
+        self.model.set_status(source_indexes, self.current_status)
     
     def load_current_status(self, app_config):
         """現在のステータス設定を読み込んでテーブルに反映"""
-        for row_idx, zekken in enumerate(self.all_zekkens):
-            # 区間ステータス
-            for col_idx, section in enumerate(self.sections, start=1):
-                current_status = app_config.get_section_status(zekken, section) or ""
-                abbrev = self._status_to_abbrev(current_status)
-                item = self.table.item(row_idx, col_idx)
-                if item:
-                    item.setText(abbrev)
-                    self._update_cell_color(item, current_status)
-            
-            # Total Result ステータス
-            total_result_status = app_config.get_final_status(zekken) or ""
-            abbrev = self._status_to_abbrev(total_result_status)
-            total_result_item = self.table.item(row_idx, self.total_result_col)
-            if total_result_item:
-                total_result_item.setText(abbrev)
-                self._update_cell_color(total_result_item, total_result_status)
-            
-            # ペナルティ
-            penalty = app_config.get_penalty(zekken)
-            penalty_item = self.table.item(row_idx, self.penalty_col)
-            if penalty_item:
-                if penalty != 0.0:
-                    penalty_item.setText(str(penalty))
-                else:
-                    penalty_item.setText("")
+        self.model.load_status(app_config)
     
     def save_status(self, app_config):
         """ステータスを保存"""
-        for row_idx, zekken in enumerate(self.all_zekkens):
-            # 区間ステータス
-            for col_idx, section in enumerate(self.sections, start=1):
-                item = self.table.item(row_idx, col_idx)
-                if item:
-                    abbrev = item.text()
-                    status = self._abbrev_to_status(abbrev)
-                    if status:
-                        app_config.set_section_status(zekken, section, status)
-            
-            # Total Result ステータス
-            total_result_item = self.table.item(row_idx, self.total_result_col)
-            if total_result_item:
-                abbrev = total_result_item.text()
-                status = self._abbrev_to_status(abbrev)
-                if status:
-                    app_config.set_final_status(zekken, status)
-            
-            # ペナルティ
-            penalty_item = self.table.item(row_idx, self.penalty_col)
-            if penalty_item:
-                penalty_text = penalty_item.text().strip()
-                if penalty_text:
-                    try:
-                        penalty = float(penalty_text)
-                        app_config.set_penalty(zekken, penalty)
-                    except ValueError:
-                        pass  # 無効な数字は無視
+        self.model.save_status(app_config)
     
     def clear_all(self):
         """すべてクリア"""
-        for row_idx in range(self.table.rowCount()):
-            for col_idx in range(1, self.table.columnCount()):
-                item = self.table.item(row_idx, col_idx)
-                if item:
-                    item.setText("")
-                    self._update_cell_color(item, "")
+        self.model.clear_all()
 
 
 class FinalStatusDialog(QDialog):
     """最終ステータス設定ダイアログ"""
     
-    def __init__(self, parent, app_config, config_loader):
+    # セルの色
+    ZEKKEN_BRUSH = QBrush(QColor(240, 240, 240))
+    PENALTY_BRUSH = QBrush(QColor(255, 250, 205))  # 淡い黄色
+    TEXT_BRUSH = QBrush(Qt.black)  # 黒文字
+    CHECKED_BRUSH = QBrush(QColor(200, 255, 200))  # 緑色
+    UNCHECKED_BRUSH = QBrush(Qt.white)
+    
+    def __init__(self, parent, app_config, config_loader, status_matrix=None):
         super().__init__(parent)
         self.app_config = app_config
         self.config_loader = config_loader
         self.setWindowTitle("最終ステータス設定")
         self.setMinimumSize(600, 500)
         
-        self.zekkens = sorted(config_loader.entries_dict.keys())
+        self.status_matrix = status_matrix or config_loader.build_status_matrix()
+        self.zekkens = self.status_matrix.zekkens
         self.status_options = ["", "RIT", "N.C.", "BLNK"]
         
         self._create_widgets()
@@ -718,28 +901,36 @@ class FinalStatusDialog(QDialog):
         self.table.setColumnWidth(4, 80)   # N.C.
         self.table.setColumnWidth(5, 80)   # BLNK
         
-        for row_idx, zekken in enumerate(self.zekkens):
-            # ゼッケン列（編集不可）
-            zekken_item = QTableWidgetItem(str(zekken))
-            zekken_item.setFlags(Qt.ItemIsEnabled)
-            zekken_item.setBackground(QBrush(QColor(240, 240, 240)))
-            zekken_item.setForeground(QBrush(QColor(0, 0, 0)))  # 黒文字
-            zekken_item.setTextAlignment(Qt.AlignCenter)
-            self.table.setItem(row_idx, 0, zekken_item)
-            
-            # ペナルティ列（数値入力可能）
-            penalty_item = QTableWidgetItem("")
-            penalty_item.setTextAlignment(Qt.AlignCenter)
-            penalty_item.setBackground(QBrush(QColor(255, 250, 205)))  # 淡い黄色
-            penalty_item.setForeground(QBrush(QColor(0, 0, 0)))  # 黒文字
-            self.table.setItem(row_idx, 1, penalty_item)
-            
-            # ステータス列（チェックボックス的に使用）
-            for col_idx, status in enumerate(self.status_options, start=2):
-                status_item = QTableWidgetItem("")
-                status_item.setTextAlignment(Qt.AlignCenter)
-                status_item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
-                self.table.setItem(row_idx, col_idx, status_item)
+        # 列ごとのプロトタイプ（書式・フラグ設定済み、clone() で複製して使う）
+        zekken_prototype = _CenteredItem()
+        zekken_prototype.setFlags(Qt.ItemIsEnabled)  # 編集不可
+        zekken_prototype.setBackground(self.ZEKKEN_BRUSH)
+        zekken_prototype.setForeground(self.TEXT_BRUSH)
+        
+        penalty_prototype = _CenteredItem()  # 数値入力可能
+        penalty_prototype.setBackground(self.PENALTY_BRUSH)
+        penalty_prototype.setForeground(self.TEXT_BRUSH)
+        
+        status_prototype = _CenteredItem()  # チェックボックス的に使用
+        status_prototype.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
+        status_cols = range(2, 2 + len(self.status_options))
+        
+        self._begin_batch_update()
+        try:
+            for row_idx, zekken in enumerate(self.zekkens):
+                # ゼッケン列
+                zekken_item = zekken_prototype.clone()
+                zekken_item.setText(str(zekken))
+                self.table.setItem(row_idx, 0, zekken_item)
+                
+                # ペナルティ列
+                self.table.setItem(row_idx, 1, penalty_prototype.clone())
+                
+                # ステータス列
+                for col_idx in status_cols:
+                    self.table.setItem(row_idx, col_idx, status_prototype.clone())
+        finally:
+            self._end_batch_update()
         
         # セルクリックイベント
         self.table.itemClicked.connect(self._on_cell_clicked)
@@ -766,24 +957,49 @@ class FinalStatusDialog(QDialog):
         
         self.setLayout(layout)
     
+    def _begin_batch_update(self):
+        """セルを一括で書き換える間、再描画とシグナルを止める"""
+        self.table.setUpdatesEnabled(False)
+        self.table.blockSignals(True)
+    
+    def _end_batch_update(self):
+        """一括書き換え後に再描画とシグナルを再開"""
+        self.table.blockSignals(False)
+        self.table.setUpdatesEnabled(True)
+    
+    def reload(self, app_config):
+        """ウィジェットを作り直さずに、保存済みの設定を読み込み直す"""
+        self.app_config = app_config
+        self._clear_table()
+        self._load_current_status()
+    
     def _load_current_status(self):
         """現在のステータス設定とペナルティを読み込んでテーブルに反映"""
-        for row_idx, zekken in enumerate(self.zekkens):
-            # ペナルティを読み込み
-            penalty = self.app_config.get_penalty(zekken)
-            penalty_item = self.table.item(row_idx, 1)
-            if penalty_item and penalty != 0.0:
-                penalty_item.setText(str(penalty))
-            
-            # 最終ステータスを読み込み
-            current_status = self.app_config.get_final_status(zekken) or ""
-            if current_status == "" or current_status in self.status_options:
-                # 該当するステータス列にマークをつける
-                col_idx = 2 + self.status_options.index(current_status)
-                status_item = self.table.item(row_idx, col_idx)
-                if status_item:
-                    status_item.setText("✓")
-                    status_item.setBackground(QBrush(QColor(200, 255, 200)))  # 緑色
+        # 設定の辞書を直接引き、ステータス → 列 の対応も先に作っておく
+        penalty_map = self.app_config.penalty_map
+        final_status = self.app_config.final_status
+        status_cols = {status: col_idx for col_idx, status in enumerate(self.status_options, start=2)}
+        
+        self._begin_batch_update()
+        try:
+            for row_idx, zekken in enumerate(self.zekkens):
+                # ペナルティを読み込み
+                penalty = penalty_map.get(zekken, 0.0)
+                penalty_item = self.table.item(row_idx, 1)
+                if penalty_item and penalty != 0.0:
+                    penalty_item.setText(str(penalty))
+                
+                # 最終ステータスを読み込み
+                current_status = final_status.get(zekken) or ""
+                col_idx = status_cols.get(current_status)
+                if col_idx is not None:
+                    # 該当するステータス列にマークをつける
+                    status_item = self.table.item(row_idx, col_idx)
+                    if status_item:
+                        status_item.setText("✓")
+                        status_item.setBackground(self.CHECKED_BRUSH)
+        finally:
+            self._end_batch_update()
     
     def _on_cell_clicked(self, item):
         """セルがクリックされた時"""
@@ -805,11 +1021,11 @@ class FinalStatusDialog(QDialog):
                 other_item = self.table.item(row, c)
                 if other_item:
                     other_item.setText("")
-                    other_item.setBackground(QBrush(QColor(255, 255, 255)))
+                    other_item.setBackground(self.UNCHECKED_BRUSH)
             
             # クリックされたセルにチェックマークをつける
             item.setText("✓")
-            item.setBackground(QBrush(QColor(200, 255, 200)))
+            item.setBackground(self.CHECKED_BRUSH)
     
     def _save(self):
         """ステータスとペナルティを保存"""
@@ -827,7 +1043,6 @@ class FinalStatusDialog(QDialog):
                 try:
                     penalty_value = float(penalty_item.text())
                     # 有限の数値かチェック（inf, -inf, NaNは無効）
-                    import math
                     if not math.isfinite(penalty_value):
                         invalid_penalties.append((zekken, penalty_item.text()))
                     elif penalty_value != 0.0:
@@ -869,6 +1084,12 @@ class FinalStatusDialog(QDialog):
         """すべてクリア"""
         reply = QMessageBox.question(self, "確認", "すべての最終ステータス設定とペナルティをクリアしますか？")
         if reply == QMessageBox.Yes:
+            self._clear_table()
+    
+    def _clear_table(self):
+        """テーブルのペナルティとステータスを空にする"""
+        self._begin_batch_update()
+        try:
             for row_idx in range(self.table.rowCount()):
                 # ペナルティをクリア
                 penalty_item = self.table.item(row_idx, 1)
@@ -880,26 +1101,273 @@ class FinalStatusDialog(QDialog):
                     status_item = self.table.item(row_idx, col_idx)
                     if status_item:
                         status_item.setText("")
-                        status_item.setBackground(QBrush(QColor(255, 255, 255)))
+                        status_item.setBackground(self.UNCHECKED_BRUSH)
+        finally:
+            self._end_batch_update()
 
 
 
+class ResultTableModel(QAbstractTableModel):
+    """区間結果テーブルのモデル
+    
+    calc_engine.results を直接参照し、セルの内容は表示時に data() で生成する。
+    QTableWidgetItem をセルごとに作成しないため、大量のエントリーでも軽量に動作する。
+    """
+    
+    # 固定列数（ゼッケン, ドライバー名, 得点, 順位）
+    FIXED_COLUMN_COUNT = 4
+    # 区間ごとの列数（START, GOAL, 走行時間, 差分, 順位, 得点）
+    SECTION_COLUMN_COUNT = 6
+    
+    # セルの色（data() はセルごとに呼ばれるため毎回生成せずクラス定数として保持。他クラスの色定数も同様）
+    OK_COLOR = QColor("#388E3C")  # 緑
+    NG_COLOR = QColor("#D32F2F")  # 赤
+    # 差分（絶対値）の色分け: DIFF_THRESHOLDS の各値以上で次の色に切り替える
+    DIFF_THRESHOLDS = np.array([1.0])
+    DIFF_BUCKET_COLORS = (OK_COLOR, NG_COLOR)  # 1秒未満=緑、1秒以上=赤
+    FIRST_PLACE_BRUSH = QBrush(QColor("#FFD700"))  # 黄色
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.calc_engine = None
+        self.config_loader = None
+        self.columns = []
+        self.zekkens = []
+        self.sections = []
+        self.section_types = []
+        self.co_tolerances = []
+        self.start_times = {}
+        self.goal_times = {}
+        self.entries_dict = {}
+        self.scores = {}
+        self.ranks = {}
+        self.result_grid = []
+        self.diff_texts = []
+        self.diff_buckets = []
+    
+    def set_table_data(self, calc_engine, config_loader, zekkens, sections, columns, scores, ranks):
+        """表示データを差し替える"""
+        self.beginResetModel()
+        self.calc_engine = calc_engine
+        self.config_loader = config_loader
+        self.zekkens = zekkens
+        self.sections = sections
+        # 区間ごとの競技タイプと CO 許容時間（section_dict の time）はセルごとに引かず先に求める
+        self.section_types = [calc_engine._get_section_type(section) for section in sections]
+        self.co_tolerances = [config_loader.section_dict.get(section, 0) for section in sections]
+        # セルごとに属性をたどらないよう、参照する辞書を直接保持
+        self.start_times = calc_engine.race.start_time
+        self.goal_times = calc_engine.race.goal_time
+        self.entries_dict = config_loader.entries_dict
+        self.columns = columns
+        self.scores = scores
+        self.ranks = ranks
+        
+        # 区間結果を 行×区間 の格子に展開（data() のたびに辞書をたどらない）
+        self.result_grid = [
+            [calc_engine.results[zekken].get(section) for section in sections]
+            for zekken in zekkens
+        ]
+        
+        # 差分は 行×区間 の配列にまとめ、表示文字列（00.00形式、符号なし）と
+        # 色分けの区分（DIFF_THRESHOLDS による）を一括で求めておく
+        abs_diffs = np.abs(np.array(
+            [[np.nan if result is None or result.diff is None else result.diff for result in row]
+             for row in self.result_grid],
+            dtype=float
+        ).reshape(len(zekkens), len(sections)))
+        self.diff_texts = np.char.mod("%.2f", abs_diffs).tolist()
+        self.diff_buckets = np.searchsorted(self.DIFF_THRESHOLDS, abs_diffs, side="right").tolist()
+        self.endResetModel()
+    
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.zekkens)
+    
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.columns)
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.columns[section]
+        return super().headerData(section, orientation, role)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        
+        if role not in (Qt.DisplayRole, Qt.ForegroundRole, Qt.BackgroundRole):
+            return None
+        
+        text, foreground, background = self._cell(index.row(), index.column())
+        if role == Qt.DisplayRole:
+            return text
+        if role == Qt.ForegroundRole:
+            return foreground
+        return background
+    
+    def _cell(self, row, col):
+        """セルの (表示文字列, 文字色, 背景色) を取得"""
+        zekken = self.zekkens[row]
+        
+        # 固定列
+        if col < self.FIXED_COLUMN_COUNT:
+            return self._fixed_cell_text(zekken, col), None, None
+        
+        section_idx, field = divmod(col - self.FIXED_COLUMN_COUNT, self.SECTION_COLUMN_COUNT)
+        section = self.sections[section_idx]
+        
+        result = self.result_grid[row][section_idx]
+        if result is None:
+            # データなし
+            return "ー", None, None
+        
+        # RIT, BLNKの場合: タイム表示無し、すべてステータス表示
+        # N.C.の場合: タイム表示あり、差分算出、順位は除外
+        if result.status and result.status != "N.C.":
+            return result.status, None, None
+        
+        # 区間タイプを取得
+        section_type = self.section_types[section_idx]
+        
+        if field == 0:
+            # START
+            return self.start_times.get(zekken, {}).get(section, "ー"), None, None
+        
+        if field == 1:
+            # GOAL
+            return self.goal_times.get(zekken, {}).get(section, "ー"), None, None
+        
+        if field == 2:
+            # 走行時間
+            return (result.passage_str if result.passage_time else "ー"), None, None
+        
+        if field == 3:
+            # 差分
+            if result.diff is None:
+                return "ー", None, None
+            if section_type == "CO" and not result.status:
+                # CO: OK/NG 表示
+                # CO の許容時間
+                co_tolerance = self.co_tolerances[section_idx]
+                if abs(result.diff) <= co_tolerance:
+                    return "OK", self.OK_COLOR, None
+                return "NG", self.NG_COLOR, None
+            # PC/PCG: 差分を秒で表示（色付き）
+            return self.diff_texts[row][section_idx], self._diff_color(row, section_idx, section_type), None
+        
+        if field == 4:
+            # 順位
+            if result.status:
+                # N.C.を表示
+                return result.status, None, None
+            if section_type == "CO":
+                # CO: 順位は "-" を表示
+                return "-", None, None
+            if result.rank:
+                # PC/PCG: 順位を表示（色付き）
+                return str(result.rank), None, self._rank_background(result.rank)
+            return "ー", None, None
+        
+        # 得点
+        return str(result.point), None, None
+    
+    def _fixed_cell_text(self, zekken, col):
+        """固定列（ゼッケン, ドライバー名, 得点, 順位）の表示文字列を取得"""
+        if col == 0:
+            return str(zekken)
+        
+        if col == 1:
+            # ドライバー名を取得
+            entry = self.entries_dict.get(zekken)
+            driver_name = entry.get('DriverName', '') if entry is not None else ""
+            if not driver_name:
+                driver_name = f"#{zekken}"
+            return driver_name
+        
+        if col == 2:
+            # 表示する区間の得点
+            return str(self.scores.get(zekken, 0))
+        
+        # 表示する区間の順位
+        return str(self.ranks.get(zekken, "-"))
+    
+    def _diff_color(self, row, section_idx, section_type="PC"):
+        """差分セルの文字色を取得（PC/PCG用）
+        
+        Args:
+            row: 行番号
+            section_idx: 区間の列番号（sections 内の位置）
+            section_type: 区間タイプ（PC, PCG, CO）
+        
+        Returns:
+            文字色（色付けしない場合は None）
+        """
+        # CO の場合は色付けしない（OK/NG表示で色付け）
+        if section_type == "CO":
+            return None
+        
+        # PC/PCG の場合: 1秒以上=赤、1秒以内=緑
+        return self.DIFF_BUCKET_COLORS[self.diff_buckets[row][section_idx]]
+    
+    def _rank_background(self, rank):
+        """順位セルの背景色を取得（1位のみ黄色背景）
+        
+        Args:
+            rank: 順位
+        
+        Returns:
+            背景色（色付けしない場合は None）
+        """
+        # 1位のみ黄色背景
+        if rank == 1:
+            return self.FIRST_PLACE_BRUSH
+        return None
+
+
 class ResultTableWidget(QWidget):
     """結果表示テーブルウィジェット"""
     
+    # 区間ごとの列の項目名（ヘッダーは「区間名\n項目名」の2段表示）
+    SECTION_COLUMN_FIELDS = ("START", "GOAL", "走行時間", "差分", "順位", "得点")
+    
+    # 列幅（固定列は列名、区間列は改行以降の項目名で引く）
+    FIXED_COLUMN_WIDTHS = {
+        "ゼッケン": 60, "ドライバー名": 120,
+        "総合得点": 70, "得点": 70, "総合順位": 70, "順位": 70,
+    }
+    SECTION_COLUMN_WIDTHS = {
+        "START": 95, "GOAL": 95, "走行時間": 70, "差分": 60, "順位": 50, "得点": 50,
+    }
+    DEFAULT_COLUMN_WIDTH = 80
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.calc_engine = None
         self.config_loader = None
         self.filter_sections = None  # None = すべて表示
+        self.zekkens = []  # ゼッケン一覧（set_data 時に一度だけソート）
+        self._last_results_version = None  # 前回表示した計算結果の版
+        self._pending_data = None  # 表示時まで描画を遅延するデータ (calc_engine, config_loader, sections)
+        self._score_cache = {}  # 区間の組 (tuple) → {ゼッケン: 得点}（フィルター切替時の再計算を省く）
+        self._score_cache_version = None  # _score_cache を作った計算結果の版
+        self._last_rendered_key = None  # 現在表示中の (区間の組, 計算結果の版)
         
         self._create_widgets()
     
     def _create_widgets(self):
         layout = QVBoxLayout()
         
-        # テーブル
-        self.table = QTableWidget()
+        # テーブル（セルはモデルから必要な分だけ描画される）
+        self.model = ResultTableModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         # ソート機能を無効化
         self.table.setSortingEnabled(False)
         # 列幅は_set_column_widths()で個別に設定
@@ -912,9 +1380,17 @@ class ResultTableWidget(QWidget):
         self.setLayout(layout)
     
     def set_data(self, calc_engine, config_loader):
-        """データをセット"""
+        """データをセット（計算結果が前回から変わっていなければ再描画しない）"""
+        version = (id(calc_engine), calc_engine.version, id(config_loader))
+        if version == self._last_results_version:
+            return
+        self._last_results_version = version
+        
         self.calc_engine = calc_engine
         self.config_loader = config_loader
+        self._last_rendered_key = None
+        # フィルター切替のたびにソートし直さないよう、ここで一度だけ並べる
+        self.zekkens = sorted(calc_engine.results.keys())
         
         # OutputFormatterを使って総合順位を計算
         from output_formatter import OutputFormatter
@@ -928,14 +1404,27 @@ class ResultTableWidget(QWidget):
         self.filter_sections = sections
         self._populate_table()
     
+    def set_deferred_data(self, calc_engine, config_loader, sections):
+        """データとフィルターを予約し、ensure_populated() が呼ばれるまで描画しない"""
+        self._pending_data = (calc_engine, config_loader, sections)
+    
+    def ensure_populated(self):
+        """予約済みのデータがあれば描画する（タブが初めて表示されたときに呼ぶ）"""
+        if self._pending_data is None:
+            return
+        calc_engine, config_loader, sections = self._pending_data
+        self._pending_data = None
+        # 先にフィルターを設定し、全区間での描画を省く（区間が変わった場合は必ず再描画）
+        if sections != self.filter_sections:
+            self.filter_sections = sections
+            self._last_results_version = None
+        self.set_data(calc_engine, config_loader)
+    
     def _populate_table(self):
         """テーブルにデータを入力"""
         if not self.calc_engine or not self.config_loader:
             return
         
-        # 描画最適化：更新を一時停止
-        self.table.setUpdatesEnabled(False)
-        
         # 表示する区間を決定
         if self.filter_sections is None:
             sections = self.config_loader.get_section_order()
@@ -944,24 +1433,32 @@ class ResultTableWidget(QWidget):
             sections = self.filter_sections
             is_all_sections = False
         
-        # ゼッケン一覧
-        zekkens = sorted(self.calc_engine.results.keys())
+        # 同じ計算結果・区間の組がすでに表示されていれば何もしない（同じフィルターの連続クリックなど）
+        results_version = (id(self.calc_engine), self.calc_engine.version, id(self.config_loader))
+        sections_key = tuple(sections)
+        rendered_key = (sections_key, results_version)
+        if rendered_key == self._last_rendered_key:
+            return
         
-        # 表示する区間の得点と順位を計算
-        scores = {}
-        for zekken in zekkens:
-            scores[zekken] = self.calc_engine.get_score_for_sections(zekken, sections)
+        # ゼッケン一覧
+        zekkens = self.zekkens
+        
+        # 表示する区間の得点と順位を計算（同じ計算結果・区間の組なら前回の得点を使い回す）
+        if results_version != self._score_cache_version:
+            self._score_cache = {}
+            self._score_cache_version = results_version
+        scores = self._score_cache.get(sections_key)
+        if scores is None:
+            # 得点行列の列和で全ゼッケン分を一括計算
+            scores = self.calc_engine.get_scores_for_sections(sections)
+            self._score_cache[sections_key] = scores
         
         # 得点に基づいて順位を計算（降順、同点は同順位）
-        sorted_scores = sorted(scores.items(), key=lambda x: x[1], reverse=True)
-        ranks = {}
-        current_rank = 1
-        prev_score = None
-        for idx, (zekken, score) in enumerate(sorted_scores, start=1):
-            if prev_score is not None and score < prev_score:
-                current_rank = idx
-            ranks[zekken] = current_rank
-            prev_score = score
+        # 順位 = 自分より得点の高いエントリー数 + 1 を、昇順に並べた得点への二分探索で一括計算
+        score_arr = np.array([scores[zekken] for zekken in zekkens], dtype=np.int64)
+        sorted_asc = np.sort(score_arr)
+        rank_arr = len(score_arr) - np.searchsorted(sorted_asc, score_arr, side="right") + 1
+        ranks = dict(zip(zekkens, rank_arr.tolist()))
         
         # カラム構成（2段ヘッダー：改行で区切る）
         # 全日表示の場合は「総合」、日別表示の場合は「得点」「順位」
@@ -970,239 +1467,238 @@ class ResultTableWidget(QWidget):
         else:
             columns = ["ゼッケン", "ドライバー名", "得点", "順位"]
         
-        for section in sections:
-            columns.extend([
-                f"{section}\nSTART",
-                f"{section}\nGOAL",
-                f"{section}\n走行時間",
-                f"{section}\n差分",
-                f"{section}\n順位",
-                f"{section}\n得点"
-            ])
-        
-        # テーブル設定
-        self.table.clear()
-        self.table.setRowCount(len(zekkens))
-        self.table.setColumnCount(len(columns))
-        self.table.setHorizontalHeaderLabels(columns)
-        
-        # 列幅を設定
-        self._set_column_widths(columns)
-        
-        # データ入力
-        for row_idx, zekken in enumerate(zekkens):
-            # 固定列
-            self._set_item(row_idx, 0, str(zekken))
-            
-            # ドライバー名を取得
-            driver_name = ""
-            if zekken in self.config_loader.entries_dict:
-                driver_name = self.config_loader.entries_dict[zekken].get('DriverName', '')
-            if not driver_name:
-                driver_name = f"#{zekken}"
-            self._set_item(row_idx, 1, driver_name)
-            
-            # 表示する区間の得点を表示
-            section_score = scores.get(zekken, 0)
-            self._set_item(row_idx, 2, str(section_score))
-            
-            # 表示する区間の順位を表示
-            section_rank = ranks.get(zekken, "-")
-            self._set_item(row_idx, 3, str(section_rank))
-            
-            col_idx = 4
+        columns += [f"{section}\n{field}" for section in sections for field in self.SECTION_COLUMN_FIELDS]
+        
+        # 描画最適化：更新・シグナル・ソートを一時停止
+        # （resizeColumnsToContents などの内容依存のリサイズは行わない）
+        sorting_enabled = self.table.isSortingEnabled()
+        self.table.setSortingEnabled(False)
+        self.table.blockSignals(True)
+        self.table.setUpdatesEnabled(False)
+        try:
+            # モデルを差し替え（セルの内容は表示時に生成される）
+            self.model.set_table_data(
+                self.calc_engine, self.config_loader,
+                zekkens, sections, columns, scores, ranks
+            )
             
-            # 各区間のデータ
-            for section in sections:
-                if section not in self.calc_engine.results[zekken]:
-                    # データなし
-                    for _ in range(6):
-                        self._set_item(row_idx, col_idx, "ー")
-                        col_idx += 1
-                    continue
-                
-                result = self.calc_engine.results[zekken][section]
-                # 区間タイプを取得
-                section_type = self.calc_engine._get_section_type(section)
-                
-                if result.status:
-                    # ステータスあり
-                    if result.status == "N.C.":
-                        # N.C.の場合: タイム表示あり、差分算出、順位は除外
-                        # START
-                        start_time = self._get_time_str(zekken, section, "START")
-                        self._set_item(row_idx, col_idx, start_time)
-                        col_idx += 1
-                        
-                        # GOAL
-                        goal_time = self._get_time_str(zekken, section, "GOAL")
-                        self._set_item(row_idx, col_idx, goal_time)
-                        col_idx += 1
-                        
-                        # 走行時間
-                        passage_str = self.calc_engine.format_time(result.passage_time) if result.passage_time else "ー"
-                        self._set_item(row_idx, col_idx, passage_str)
-                        col_idx += 1
-                        
-                        # 差分（色付き）- 秒単位で±00.00形式
-                        diff_str = self._format_diff_simple(result.diff) if result.diff is not None else "ー"
-                        item = self._set_item(row_idx, col_idx, diff_str)
-                        if result.diff is not None:
-                            self._color_diff_cell(item, result.diff, section_type)
-                        col_idx += 1
-                        
-                        # 順位: N.C.を表示
-                        self._set_item(row_idx, col_idx, result.status)
-                        col_idx += 1
-                        
-                        # 得点
-                        self._set_item(row_idx, col_idx, str(result.point))
-                        col_idx += 1
-                    else:
-                        # RIT, BLNKの場合: タイム表示無し、すべてステータス表示
-                        for _ in range(6):
-                            self._set_item(row_idx, col_idx, result.status)
-                            col_idx += 1
-                else:
-                    # START
-                    start_time = self._get_time_str(zekken, section, "START")
-                    self._set_item(row_idx, col_idx, start_time)
-                    col_idx += 1
-                    
-                    # GOAL
-                    goal_time = self._get_time_str(zekken, section, "GOAL")
-                    self._set_item(row_idx, col_idx, goal_time)
-                    col_idx += 1
-                    
-                    # 走行時間
-                    passage_str = self.calc_engine.format_time(result.passage_time) if result.passage_time else "ー"
-                    self._set_item(row_idx, col_idx, passage_str)
-                    col_idx += 1
-                    
-                    # 差分の表示とフォーマット
-                    if section_type == "CO":
-                        # CO: OK/NG 表示
-                        # CO の許容時間を取得（section_dict から time フィールド）
-                        co_tolerance = self.config_loader.section_dict.get(section, 0)
-                        if result.diff is not None:
-                            if abs(result.diff) <= co_tolerance:
-                                diff_str = "OK"
-                                color = QColor("#388E3C")  # 緑
-                            else:
-                                diff_str = "NG"
-                                color = QColor("#D32F2F")  # 赤
-                            item = self._set_item(row_idx, col_idx, diff_str)
-                            item.setForeground(color)
-                        else:
-                            self._set_item(row_idx, col_idx, "ー")
-                    else:
-                        # PC/PCG: 差分を秒で表示（色付き）
-                        diff_str = self._format_diff_simple(result.diff) if result.diff is not None else "ー"
-                        item = self._set_item(row_idx, col_idx, diff_str)
-                        if result.diff is not None:
-                            self._color_diff_cell(item, result.diff, section_type)
-                    col_idx += 1
-                    
-                    # 順位
-                    if section_type == "CO":
-                        # CO: 順位は "-" を表示
-                        self._set_item(row_idx, col_idx, "-")
-                    else:
-                        # PC/PCG: 順位を表示（色付き）
-                        rank_str = str(result.rank) if result.rank else "ー"
-                        item = self._set_item(row_idx, col_idx, rank_str)
-                        if result.rank:
-                            self._color_rank_cell(item, result.rank)
-                    col_idx += 1
-                    
-                    # 得点
-                    self._set_item(row_idx, col_idx, str(result.point))
-                    col_idx += 1
+            # 列幅を設定
+            self._set_column_widths(columns)
+        finally:
+            # 描画最適化：更新を再開
+            self.table.blockSignals(False)
+            self.table.setSortingEnabled(sorting_enabled)
+            self.table.setUpdatesEnabled(True)
         
-        # 描画最適化：更新を再開
-        self.table.setUpdatesEnabled(True)
+        self._last_rendered_key = rendered_key
     
     def _set_column_widths(self, columns):
-        """列名に応じて最適な列幅を設定"""
-        for col_idx, col_name in enumerate(columns):
-            if col_name == "ゼッケン":
-                self.table.setColumnWidth(col_idx, 60)
-            elif col_name == "ドライバー名":
-                self.table.setColumnWidth(col_idx, 120)
-            elif col_name in ["総合得点", "得点"]:
-                self.table.setColumnWidth(col_idx, 70)
-            elif col_name in ["総合順位", "順位"]:
-                self.table.setColumnWidth(col_idx, 70)
-            elif "\nSTART" in col_name or "\nGOAL" in col_name:
-                self.table.setColumnWidth(col_idx, 95)
-            elif "\n走行時間" in col_name:
-                self.table.setColumnWidth(col_idx, 70)
-            elif "\n差分" in col_name:
-                self.table.setColumnWidth(col_idx, 60)
-            elif "\n順位" in col_name:
-                self.table.setColumnWidth(col_idx, 50)
-            elif "\n得点" in col_name:
-                self.table.setColumnWidth(col_idx, 50)
-            else:
-                # デフォルト
-                self.table.setColumnWidth(col_idx, 80)
-    
-    def _format_diff_simple(self, seconds: float) -> str:
-        """差分を00.00形式でフォーマット（秒単位、符号なし）"""
-        if seconds is None:
-            return "ー"
-        
-        return f"{abs(seconds):.2f}"
-    
-    def _set_item(self, row, col, text):
-        """セルにアイテムをセット"""
-        item = QTableWidgetItem(text)
-        item.setTextAlignment(Qt.AlignCenter)
-        self.table.setItem(row, col, item)
-        return item
-    
-    def _get_time_str(self, zekken, section, timing_type):
-        """START/GOAL 時刻を取得"""
-        if timing_type == "START":
-            if zekken in self.calc_engine.race.start_time and section in self.calc_engine.race.start_time[zekken]:
-                return self.calc_engine.race.start_time[zekken][section]
-        elif timing_type == "GOAL":
-            if zekken in self.calc_engine.race.goal_time and section in self.calc_engine.race.goal_time[zekken]:
-                return self.calc_engine.race.goal_time[zekken][section]
-        return "ー"
-    
-    def _color_diff_cell(self, item, diff, section_type="PC"):
-        """差分セルに色を付ける（PC/PCG用）
+        """列名に応じて最適な列幅を設定
         
-        Args:
-            item: テーブルアイテム
-            diff: 差分（秒）
-            section_type: 区間タイプ（PC, PCG, CO）
+        列ごとの sectionResized シグナルを止めて幅をまとめて設定し、最後に一度だけレイアウトを更新する。
         """
-        # CO の場合は色付けしない（OK/NG表示で色付け）
-        if section_type == "CO":
-            return
+        header = self.table.horizontalHeader()
+        blocker = QSignalBlocker(header)
+        try:
+            for col_idx, col_name in enumerate(columns):
+                # 区間列は「区間名\n項目名」の項目名、固定列は列名そのもので幅を引く
+                _, sep, field_name = col_name.rpartition("\n")
+                widths = self.SECTION_COLUMN_WIDTHS if sep else self.FIXED_COLUMN_WIDTHS
+                header.resizeSection(col_idx, widths.get(field_name, self.DEFAULT_COLUMN_WIDTH))
+        finally:
+            blocker.unblock()
+        # シグナルを止めていた間の列幅変更をスクロール範囲・表示に反映
+        self.table.doItemsLayout()
+
+
+class SummaryTableModel(QAbstractTableModel):
+    """総合成績テーブルのモデル
+    
+    set_summary() で summary_df の表示文字列を列単位でまとめて整形しておき、
+    data() では整形済みの値を参照するだけにする。
+    """
+    
+    # 列: Result, No, DriverName, CoDriverName, CarName, 車両製造年, CarClass, Point, H.C.L Point, Penalty(-), TotalPoint
+    HEADERS = [
+        "Result", "No", "DriverName", "CoDriverName", "CarName",
+        "車両製造年", "CarClass", "Point", "H.C.L Point", "Penalty(-)", "TotalPoint"
+    ]
+    
+    # そのまま文字列化して表示する列
+    TEXT_COLUMNS = ["No", "DriverName", "CoDriverName", "CarName", "CarClass"]
+    # 数値のまま保持する列（Point, H.C.L Point, Penalty(-), TotalPoint）と、その値を返すロール
+    NUMERIC_COLUMNS = (7, 8, 9, 10)
+    SORT_ROLE = Qt.UserRole
+    
+    # 上位3位の背景色
+    PODIUM_BRUSHES = {
+        1: QBrush(QColor(255, 215, 0)),    # 金
+        2: QBrush(QColor(192, 192, 192)),  # 銀
+        3: QBrush(QColor(205, 127, 50)),   # 銅
+    }
+    PENALTY_BRUSH = QBrush(QColor(255, 0, 0))  # 赤字
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.rows = []  # 行ごとの表示文字列のタプル
+        self.penalties = []  # 行ごとのペナルティ
+        self.podium_ranks = []  # 行ごとの表彰台順位（1〜3、それ以外は0）
+        self.numeric_values = {}  # 数値列ごとの数値リスト（SORT_ROLE 用）
+        # 上位3位の太字フォント（QFont はアプリ生成後に作る必要があるためインスタンスで保持）
+        self._bold_font = QFont("", -1, QFont.Bold)
+    
+    def set_summary(self, summary_df, app_config):
+        """表示データを差し替える"""
+        self.beginResetModel()
+        self.rows = []
+        self.penalties = []
+        self.podium_ranks = []
+        self.numeric_values = {}
+        
+        if summary_df is not None and not summary_df.empty:
+            df = summary_df
+            
+            # ペナルティを取得（ゼッケンごとに get_penalty を呼ばず、辞書で一括して引く）
+            if app_config:
+                penalties = df['No'].map(app_config.penalty_map).fillna(0.0)
+            else:
+                penalties = pd.Series(0, index=df.index)
+            
+            # TotalPoint = H.C.L Point - Penalty
+            total_points = df['H.C.L Point'] - penalties
+            
+            rank_strs = df['Result'].map(self._format_rank)
+            
+            # 文字列で表示する列はまとめて一度に変換
+            text_df = df[self.TEXT_COLUMNS].astype(str)
+            
+            self.rows = list(zip(
+                rank_strs,
+                text_df['No'],
+                text_df['DriverName'],
+                text_df['CoDriverName'],
+                text_df['CarName'],
+                self._format_years(df['車両製造年']),
+                text_df['CarClass'],
+                self._format_points(df['Point']),        # 小数点2桁表示
+                self._format_points(df['H.C.L Point']),  # 小数点2桁表示
+                penalties.astype(int).tolist(),          # 整数のまま表示（0の場合も表示）
+                self._format_points(total_points),       # 小数点2桁表示
+            ))
+            self.penalties = penalties.tolist()
+            # 数値列は数値のまま保持（文字列順ではなく数値順で並べられるように）
+            self.numeric_values = dict(zip(self.NUMERIC_COLUMNS, (
+                df['Point'].tolist(),
+                df['H.C.L Point'].tolist(),
+                self.penalties,
+                total_points.tolist(),
+            )))
+            # 上位3位に色を付ける
+            self.podium_ranks = [int(r) if r in ("1", "2", "3") else 0 for r in rank_strs]
         
-        # PC/PCG の場合: 1秒以上=赤、1秒以内=緑
-        abs_diff = abs(diff)
-        if abs_diff >= 1.0:
-            # 赤文字
-            item.setForeground(QColor("#D32F2F"))
-        else:
-            # 緑文字
-            item.setForeground(QColor("#388E3C"))
+        self.endResetModel()
+    
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.HEADERS)
     
-    def _color_rank_cell(self, item, rank):
-        """順位セルに色を付ける（1位のみ黄色背景）
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
         
-        Args:
-            item: テーブルアイテム
-            rank: 順位
+        row = index.row()
+        col = index.column()
+        
+        if role == Qt.DisplayRole:
+            return self.rows[row][col]
+        
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        
+        if role == self.SORT_ROLE:
+            values = self.numeric_values.get(col)
+            return values[row] if values is not None else self.rows[row][col]
+        
+        if col == 0 and role in (Qt.BackgroundRole, Qt.FontRole):
+            # 上位3位に色を付ける
+            podium_rank = self.podium_ranks[row]
+            if not podium_rank:
+                return None
+            if role == Qt.FontRole:
+                return self._bold_font
+            return self.PODIUM_BRUSHES[podium_rank]
+        
+        if col == 9 and role == Qt.ForegroundRole:
+            # Penalty(-) - 赤字表記
+            if self.penalties[row] > 0:
+                return self.PENALTY_BRUSH
+            return None
+        
+        return None
+    
+    @staticmethod
+    def _format_rank(rank_value):
+        """Result (順位) を表示文字列に変換"""
+        if pd.notna(rank_value):
+            if isinstance(rank_value, (int, float)):
+                return str(int(rank_value))
+            return str(rank_value)  # RIT/N.C./BLNK
+        return "-"
+    
+    @staticmethod
+    def _format_year(year_value):
+        """車両製造年を表示文字列に変換（整数表示、小数点以下は切り捨て）"""
+        if year_value and pd.notna(year_value):
+            try:
+                # int(float())で小数点以下を切り捨て（例: 1928.0 -> 1928）
+                return str(int(float(year_value)))
+            except (ValueError, TypeError):
+                return str(year_value)
+        return ''
+    
+    @classmethod
+    def _format_years(cls, years):
+        """車両製造年の列をまとめて表示文字列のリストに変換
+        
+        数値に変換できる値は列単位で一括変換し、変換できない値だけ _format_year で個別に整形する。
         """
-        # 1位のみ黄色背景
-        if rank == 1:
-            color = QColor("#FFD700")  # 黄色
-            item.setBackground(QBrush(color))
+        numeric = pd.to_numeric(years, errors='coerce')
+        valid = numeric.notna() & (numeric != 0)
+        # astype(int) は int(float()) と同じく小数点以下を切り捨てる
+        year_strs = numeric.where(valid, 0).astype(np.int64).astype(str).where(valid, '')
+        others = numeric.isna() & years.notna()
+        if others.any():
+            year_strs[others] = years[others].map(cls._format_year)
+        return year_strs.tolist()
+    
+    @staticmethod
+    def _format_point(point_value):
+        """得点を小数点2桁の表示文字列に変換"""
+        try:
+            return f"{float(point_value):.2f}"
+        except (ValueError, TypeError):
+            return str(point_value)
+    
+    @classmethod
+    def _format_points(cls, points):
+        """得点の列をまとめて小数点2桁の表示文字列のリストに変換"""
+        try:
+            values = points.to_numpy(dtype=float)
+        except (ValueError, TypeError):
+            # 数値以外が混じっている場合は1件ずつ整形
+            return points.map(cls._format_point).tolist()
+        return np.char.mod('%.2f', values).tolist()
 
 
 class SummaryTableWidget(QWidget):
@@ -1214,6 +1710,9 @@ class SummaryTableWidget(QWidget):
         self.config_loader = None
         self.app_config = None
         self.summary_df = None
+        self.output_formatter = None
+        self._last_results_version = None  # 前回表示した計算結果・ペナルティの版
+        self._pending_class_data = None  # 表示時まで描画を遅延するクラス別データ（set_class_data の引数）
         
         self._create_widgets()
     
@@ -1226,15 +1725,11 @@ class SummaryTableWidget(QWidget):
         title_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(title_label)
         
-        # テーブル
-        self.table = QTableWidget()
+        # テーブル（列構成は SummaryTableModel.HEADERS）
+        self.model = SummaryTableModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         self.table.setSortingEnabled(False)
-        # 列: Result, No, DriverName, CoDriverName, CarName, 車両製造年, CarClass, Point, H.C.L Point, Penalty(-), TotalPoint
-        self.table.setColumnCount(11)
-        self.table.setHorizontalHeaderLabels([
-            "Result", "No", "DriverName", "CoDriverName", "CarName",
-            "車両製造年", "CarClass", "Point", "H.C.L Point", "Penalty(-)", "TotalPoint"
-        ])
         
         # 列幅設定
         self.table.setColumnWidth(0, 80)   # Result
@@ -1257,7 +1752,13 @@ class SummaryTableWidget(QWidget):
         self.setLayout(layout)
     
     def set_data(self, calc_engine, config_loader, app_config):
-        """データをセット"""
+        """データをセット（計算結果・ペナルティが前回から変わっていなければ再描画しない）"""
+        version = (id(calc_engine), calc_engine.version, id(config_loader),
+                   tuple(sorted(app_config.penalty_map.items())) if app_config else None)
+        if version == self._last_results_version:
+            return
+        self._last_results_version = version
+        
         self.calc_engine = calc_engine
         self.config_loader = config_loader
         self.app_config = app_config
@@ -1274,119 +1775,21 @@ class SummaryTableWidget(QWidget):
         if self.summary_df is None:
             return
         
-        # テーブル設定
-        self.table.setRowCount(len(self.summary_df))
-        
-        # データ入力
-        for row_idx, row in self.summary_df.iterrows():
-            zekken = row['No']
-            
-            # ペナルティを取得
-            penalty = self.app_config.get_penalty(zekken) if self.app_config else 0
-            hcl_point = row['H.C.L Point']
-            total_point = hcl_point - penalty
-            
-            # Result (順位)
-            rank_value = row['Result']
-            if pd.notna(rank_value):
-                if isinstance(rank_value, (int, float)):
-                    rank_str = str(int(rank_value))
-                else:
-                    rank_str = str(rank_value)  # RIT/N.C./BLNK
-            else:
-                rank_str = "-"
-            
-            rank_item = QTableWidgetItem(rank_str)
-            rank_item.setTextAlignment(Qt.AlignCenter)
-            # 上位3位に色を付ける
-            if rank_str.isdigit():
-                rank_int = int(rank_str)
-                if rank_int == 1:
-                    rank_item.setBackground(QBrush(QColor(255, 215, 0)))  # 金
-                    rank_item.setFont(QFont("", -1, QFont.Bold))
-                elif rank_int == 2:
-                    rank_item.setBackground(QBrush(QColor(192, 192, 192)))  # 銀
-                    rank_item.setFont(QFont("", -1, QFont.Bold))
-                elif rank_int == 3:
-                    rank_item.setBackground(QBrush(QColor(205, 127, 50)))  # 銅
-                    rank_item.setFont(QFont("", -1, QFont.Bold))
-            self.table.setItem(row_idx, 0, rank_item)
-            
-            # No (ゼッケン)
-            no_item = QTableWidgetItem(str(zekken))
-            no_item.setTextAlignment(Qt.AlignCenter)
-            self.table.setItem(row_idx, 1, no_item)
-            
-            # DriverName
-            driver_item = QTableWidgetItem(str(row.get('DriverName', '')))
-            driver_item.setTextAlignment(Qt.AlignCenter)
-            self.table.setItem(row_idx, 2, driver_item)
-            
-            # CoDriverName
-            codriver_item = QTableWidgetItem(str(row.get('CoDriverName', '')))
-            codriver_item.setTextAlignment(Qt.AlignCenter)
-            self.table.setItem(row_idx, 3, codriver_item)
-            
-            # CarName
-            car_item = QTableWidgetItem(str(row.get('CarName', '')))
-            car_item.setTextAlignment(Qt.AlignCenter)
-            self.table.setItem(row_idx, 4, car_item)
-            
-            # 車両製造年 (整数表示、小数点以下は切り捨て)
-            year_value = row.get('車両製造年', '')
-            if year_value and pd.notna(year_value):
-                try:
-                    # int(float())で小数点以下を切り捨て（例: 1928.0 -> 1928）
-                    year_str = str(int(float(year_value)))
-                except (ValueError, TypeError):
-                    year_str = str(year_value)
-            else:
-                year_str = ''
-            year_item = QTableWidgetItem(year_str)
-            year_item.setTextAlignment(Qt.AlignCenter)
-            self.table.setItem(row_idx, 5, year_item)
-            
-            # CarClass
-            class_item = QTableWidgetItem(str(row.get('CarClass', '')))
-            class_item.setTextAlignment(Qt.AlignCenter)
-            self.table.setItem(row_idx, 6, class_item)
-            
-            # Point (純粋な得点) - 小数点2桁表示
-            point_value = row.get('Point', 0)
-            try:
-                point_str = f"{float(point_value):.2f}"
-            except (ValueError, TypeError):
-                point_str = str(point_value)
-            point_item = QTableWidgetItem(point_str)
-            point_item.setTextAlignment(Qt.AlignCenter)
-            self.table.setItem(row_idx, 7, point_item)
-            
-            # H.C.L Point - 小数点2桁表示
-            try:
-                hcl_str = f"{float(hcl_point):.2f}"
-            except (ValueError, TypeError):
-                hcl_str = str(hcl_point)
-            hcl_item = QTableWidgetItem(hcl_str)
-            hcl_item.setTextAlignment(Qt.AlignCenter)
-            self.table.setItem(row_idx, 8, hcl_item)
-            
-            # Penalty(-) - 赤字表記（0の場合も表示）
-            penalty_item = QTableWidgetItem(str(int(penalty)))
-            penalty_item.setTextAlignment(Qt.AlignCenter)
-            if penalty > 0:
-                penalty_item.setForeground(QBrush(QColor(255, 0, 0)))  # 赤字
-            self.table.setItem(row_idx, 9, penalty_item)
-            
-            # TotalPoint - 小数点2桁表示
-            try:
-                total_str = f"{float(total_point):.2f}"
-            except (ValueError, TypeError):
-                total_str = str(total_point)
-            total_item = QTableWidgetItem(total_str)
-            total_item.setTextAlignment(Qt.AlignCenter)
-            self.table.setItem(row_idx, 10, total_item)
-    
-    def set_class_data(self, calc_engine, config_loader, app_config, class_name):
+        # 描画最適化：更新・シグナル・ソートを一時停止
+        sorting_enabled = self.table.isSortingEnabled()
+        self.table.setSortingEnabled(False)
+        self.table.blockSignals(True)
+        self.table.setUpdatesEnabled(False)
+        try:
+            # モデルを差し替え（セルの内容は表示時に生成される）
+            self.model.set_summary(self.summary_df, self.app_config)
+        finally:
+            self.table.blockSignals(False)
+            self.table.setSortingEnabled(sorting_enabled)
+            self.table.setUpdatesEnabled(True)
+    
+    def set_class_data(self, calc_engine, config_loader, app_config, class_name,
+                       output_formatter=None):
         """クラス別データをセット
         
         Args:
@@ -1394,22 +1797,107 @@ class SummaryTableWidget(QWidget):
             config_loader: 設定ローダー
             app_config: アプリケーション設定
             class_name: クラス名
+            output_formatter: 共有する OutputFormatter（クラス別サマリーのキャッシュを使い回す）
         """
+        self._pending_class_data = None
+        
+        # 計算結果・ペナルティ・クラスが前回から変わっていなければ再描画しない
+        version = (id(calc_engine), calc_engine.version, id(config_loader),
+                   tuple(sorted(app_config.penalty_map.items())) if app_config else None, class_name)
+        if version == self._last_results_version:
+            return
+        
         self.calc_engine = calc_engine
         self.config_loader = config_loader
         self.app_config = app_config
         
-        # OutputFormatterを使ってクラス別総合順位を計算
-        from output_formatter import OutputFormatter
-        self.output_formatter = OutputFormatter(calc_engine, config_loader)
+        # OutputFormatterを使ってクラス別総合順位を計算（同じ計算結果なら前回のものを使い回す）
+        if output_formatter is not None:
+            self.output_formatter = output_formatter
+        elif (self.output_formatter is None
+              or self.output_formatter.calc is not calc_engine
+              or self.output_formatter.config is not config_loader):
+            self.output_formatter = OutputFormatter(calc_engine, config_loader)
         self.summary_df = self.output_formatter.get_summary_by_class(class_name)
+        # set_data の版（クラス名を含まない）とは一致しないため、set_data で総合成績に戻すと再描画される
+        self._last_results_version = version
         
         self._populate_table()
+    
+    def set_deferred_class_data(self, calc_engine, config_loader, app_config, class_name,
+                                output_formatter=None):
+        """クラス別データを予約し、ensure_populated() が呼ばれるまで描画しない"""
+        self._pending_class_data = (calc_engine, config_loader, app_config, class_name, output_formatter)
+    
+    def ensure_populated(self):
+        """予約済みのクラス別データがあれば描画する（タブが表示されたときに呼ぶ）"""
+        if self._pending_class_data is None:
+            return
+        self.set_class_data(*self._pending_class_data)
+
+
+class ExportTask(QRunnable):
+    """ファイル出力（CSV/Excel）をワーカースレッドで実行するタスク
+    
+    export_func(filename) を実行し、完了時に signals.finished(成功可否, エラーメッセージ) を発行する。
+    シグナルはメインスレッドで受け取られるため、結果表示はそのまま GUI を操作してよい。
+    """
+    
+    class Signals(QObject):
+        finished = Signal(bool, str)
+    
+    def __init__(self, export_func, filename):
+        super().__init__()
+        self.export_func = export_func  # OutputFormatter.export_to_csv / export_to_excel
+        self.filename = filename
+        self.signals = self.Signals()
+    
+    def run(self):
+        try:
+            success = self.export_func(self.filename)
+            self.signals.finished.emit(success, "")
+        except Exception as e:
+            self.signals.finished.emit(False, str(e))
 
 
 class MainWindow(QMainWindow):
     """メインウィンドウ"""
     
+    # ステータスバーの完了メッセージ表示時間（ミリ秒）
+    STATUS_MESSAGE_TIMEOUT = 3000
+    # 処理ログに保持する最大行数（古い行から破棄）
+    LOG_MAX_BLOCK_COUNT = 1000
+    
+    # エラーステータスボタンのスタイル（状態が変わったときだけ設定する）
+    ERROR_STATUS_WARN_STYLE = """
+        QPushButton {
+            background-color: #FFEBEE;
+            color: #C62828;
+            border: 2px solid #EF5350;
+            border-radius: 4px;
+            padding: 8px;
+            font-weight: bold;
+            font-size: 14px;
+        }
+        QPushButton:hover {
+            background-color: #FFCDD2;
+        }
+    """
+    ERROR_STATUS_OK_STYLE = """
+        QPushButton {
+            background-color: #E8F5E9;
+            color: #2E7D32;
+            border: 2px solid #4CAF50;
+            border-radius: 4px;
+            padding: 8px;
+            font-weight: bold;
+            font-size: 14px;
+        }
+        QPushButton:hover {
+            background-color: #C8E6C9;
+        }
+    """
+    
     def __init__(self):
         super().__init__()
         self.setWindowTitle("PC System Tool")
@@ -1421,10 +1909,25 @@ class MainWindow(QMainWindow):
         self.race_parser = None
         self.calc_engine = None
         self.output_formatter = None
+        self._csv_export_task = None  # 実行中の CSV 出力タスク
+        self._excel_export_task = None  # 実行中の Excel 出力タスク
+        self._log_buffer = []  # 表示待ちのログメッセージ
+        
+        # 設定の保存は短時間の変更をまとめて 1 回にする
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(200)
+        self._save_timer.timeout.connect(self.app_config.flush)
+        
+        # ステータス設定ダイアログ（初回に生成し、config_loader が変わるまで使い回す）
+        self._status_matrix_dialog = None
+        self._final_status_dialog = None
+        self._folders_dialog = None  # (ダイアログ, race 入力欄, settings 入力欄)
         
         # エラー管理
         self.validation_errors: List[ValidationError] = []
         self.confirmed_errors_map = {}  # エラーキー → 確認済みステータス
+        self._race_validation_errors = None  # Race 読み込み時の検証結果（計算実行時に使い回す）
         
         # 自動読み込みフラグ
         self.auto_load_attempted = False
@@ -1524,14 +2027,8 @@ class MainWindow(QMainWindow):
         if not self.app_config.status_map and not self.app_config.final_status:
             return
         
-        status_count = 0
-        
-        # 区間ステータスの数をカウント
-        for zekken, sections in self.app_config.status_map.items():
-            status_count += len(sections)
-        
-        # 最終ステータスの数をカウント
-        status_count += len(self.app_config.final_status)
+        # 区間ステータスと最終ステータスの数をカウント
+        status_count = sum(map(len, self.app_config.status_map.values())) + len(self.app_config.final_status)
         
         if status_count > 0:
             self.log(f"✓ 保存済みステータス設定を復元しました（{status_count}件）")
@@ -1552,20 +2049,8 @@ class MainWindow(QMainWindow):
         
         self.error_status_btn = QPushButton("エラーなし")
         self.error_status_btn.setMinimumHeight(40)
-        self.error_status_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #E8F5E9;
-                color: #2E7D32;
-                border: 2px solid #4CAF50;
-                border-radius: 4px;
-                padding: 8px;
-                font-weight: bold;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #C8E6C9;
-            }
-        """)
+        self.error_status_btn.setStyleSheet(self.ERROR_STATUS_OK_STYLE)
+        self._error_status_style = self.ERROR_STATUS_OK_STYLE  # 現在設定しているスタイル
         self.error_status_btn.clicked.connect(self._open_error_dialog)
         self.error_status_btn.setVisible(False)  # 初期状態は非表示
         error_layout.addWidget(self.error_status_btn)
@@ -1619,9 +2104,9 @@ class MainWindow(QMainWindow):
         log_label.setStyleSheet("font-weight: bold;")
         left_layout.addWidget(log_label)
         
-        from PySide6.QtWidgets import QTextEdit
-        self.log_text = QTextEdit()
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
+        self.log_text.setMaximumBlockCount(self.LOG_MAX_BLOCK_COUNT)
         left_layout.addWidget(self.log_text)
         
         left_widget.setLayout(left_layout)
@@ -1638,11 +2123,13 @@ class MainWindow(QMainWindow):
         self.all_day_widget = ResultTableWidget()
         self.tab_widget.addTab(self.all_day_widget, "全日")
         
-        # 日別タブ（後で動的に生成）
-        self.day_widgets = []
+        # 日別タブ（後で動的に生成、表示時に描画）: day_widgets[タブ名] = ResultTableWidget
+        self.day_widgets = {}
+        self.tab_widget.currentChanged.connect(self._on_tab_changed)
         
-        # クラス別総合成績タブ（後で動的に生成）
+        # クラス別総合成績タブ（後で動的に生成）: class_summary_widgets[クラス名] = SummaryTableWidget
         self.class_summary_tab = None
+        self.class_tab_widget = None
         self.class_summary_widgets = {}
         
         main_layout.addWidget(self.tab_widget, stretch=3)
@@ -1667,13 +2154,13 @@ class MainWindow(QMainWindow):
         
         file_menu.addSeparator()
         
-        export_excel_action = QAction("Excel出力", self)
-        export_excel_action.triggered.connect(self.export_excel)
-        file_menu.addAction(export_excel_action)
+        self.export_excel_action = QAction("Excel出力", self)
+        self.export_excel_action.triggered.connect(self.export_excel)
+        file_menu.addAction(self.export_excel_action)
         
-        export_csv_action = QAction("CSV出力", self)
-        export_csv_action.triggered.connect(self.export_csv)
-        file_menu.addAction(export_csv_action)
+        self.export_csv_action = QAction("CSV出力", self)
+        self.export_csv_action.triggered.connect(self.export_csv)
+        file_menu.addAction(self.export_csv_action)
         
         file_menu.addSeparator()
         
@@ -1704,8 +2191,17 @@ class MainWindow(QMainWindow):
         settings_menu.addAction(folders_action)
     
     def log(self, message):
-        """ログメッセージを表示"""
-        self.log_text.append(message)
+        """ログメッセージを表示（同じイベント処理中のメッセージはまとめて追加）"""
+        if not self._log_buffer:
+            QTimer.singleShot(0, self.flush_log)
+        self._log_buffer.append(message)
+    
+    def flush_log(self):
+        """表示待ちのログメッセージを一度に追加"""
+        if not self._log_buffer:
+            return
+        self.log_text.appendPlainText("\n".join(self._log_buffer))
+        self._log_buffer.clear()
     
     def _update_error_status(self):
         """エラーステータスボタンを更新"""
@@ -1720,37 +2216,16 @@ class MainWindow(QMainWindow):
         if unconfirmed_count > 0:
             # 未確認エラーがある場合
             self.error_status_btn.setText(f"⚠️ エラーあり（未確認: {unconfirmed_count}/{total_count}）")
-            self.error_status_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #FFEBEE;
-                    color: #C62828;
-                    border: 2px solid #EF5350;
-                    border-radius: 4px;
-                    padding: 8px;
-                    font-weight: bold;
-                    font-size: 14px;
-                }
-                QPushButton:hover {
-                    background-color: #FFCDD2;
-                }
-            """)
+            style = self.ERROR_STATUS_WARN_STYLE
         else:
             # すべて確認済み
             self.error_status_btn.setText(f"✓ エラーなし（確認済み: {total_count}件）")
-            self.error_status_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #E8F5E9;
-                    color: #2E7D32;
-                    border: 2px solid #4CAF50;
-                    border-radius: 4px;
-                    padding: 8px;
-                    font-weight: bold;
-                    font-size: 14px;
-                }
-                QPushButton:hover {
-                    background-color: #C8E6C9;
-                }
-            """)
+            style = self.ERROR_STATUS_OK_STYLE
+        
+        # スタイルシートの再解析を避けるため、状態が変わったときだけ設定
+        if style is not self._error_status_style:
+            self.error_status_btn.setStyleSheet(style)
+            self._error_status_style = style
         
         self.error_status_btn.setVisible(True)
     
@@ -1771,14 +2246,20 @@ class MainWindow(QMainWindow):
         self.validation_errors = errors
         
         # 以前に確認済みのエラーを復元
+        confirmed_errors_map = self.confirmed_errors_map
         for error in self.validation_errors:
-            error_key = error.get_comparison_key()
-            if error_key in self.confirmed_errors_map:
-                error.confirmed = self.confirmed_errors_map[error_key]
+            error.confirmed = confirmed_errors_map.get(error.get_comparison_key(), error.confirmed)
         
         # ステータスを更新
         self._update_error_status()
     
+    def _remember_confirmed_errors(self):
+        """現在のエラーの確認済みステータスを、次回の検証結果へ引き継げるよう保存"""
+        if not self.validation_errors:
+            return
+        self.confirmed_errors_map.update(
+            {error.get_comparison_key(): error.confirmed for error in self.validation_errors})
+    
     def _hide_errors(self):
         """エラー表示を非表示にする"""
         self.validation_errors = []
@@ -1824,6 +2305,7 @@ class MainWindow(QMainWindow):
         
         try:
             self.log("race ファイルを解析中...")
+            self._race_validation_errors = None
             self.race_parser = RaceParser(self.app_config.race_folder)
             success, msg = self.race_parser.parse_all()
             
@@ -1841,15 +2323,14 @@ class MainWindow(QMainWindow):
             self.log("データ検証を実行中...")
             
             # 以前の確認済みステータスを保存
-            for error in self.validation_errors:
-                error_key = error.get_comparison_key()
-                self.confirmed_errors_map[error_key] = error.confirmed
+            self._remember_confirmed_errors()
             
-            validation_errors = validate_all(
+            validation_errors = validate_race_data(
                 self.app_config.race_folder,
                 self.race_parser.results,
                 self.config_loader.section_list
             )
+            self._race_validation_errors = list(validation_errors)
             
             if validation_errors:
                 self.log(f"⚠ 警告: {len(validation_errors)}件のエラー/警告が検出されました")
@@ -1906,7 +2387,7 @@ class MainWindow(QMainWindow):
             self.calc_engine.final_status = self.app_config.final_status.copy()
             
             # ステータス適用状況をログに表示
-            status_count = sum(len(sections) for sections in self.calc_engine.status_map.values())
+            status_count = sum(map(len, self.calc_engine.status_map.values()))
             final_status_count = len(self.calc_engine.final_status)
             
             if status_count > 0 or final_status_count > 0:
@@ -1929,16 +2410,19 @@ class MainWindow(QMainWindow):
             self.log("計測データ不備チェックを実行中...")
             
             # 以前の確認済みステータスを保存
-            for error in self.validation_errors:
-                error_key = error.get_comparison_key()
-                self.confirmed_errors_map[error_key] = error.confirmed
-            
-            # 再度検証を実行（今度はcalc_engineを渡す）
-            validation_errors = validate_all(
-                self.app_config.race_folder,
-                self.race_parser.results,
-                self.config_loader.section_list,
-                self.calc_engine
+            self._remember_confirmed_errors()
+            
+            # Race 読み込み時の検証結果に、計算結果に対する検証結果を加える
+            # （race フォルダの検証は Race 読み込み時の結果を使い回す）
+            if self._race_validation_errors is None:
+                self._race_validation_errors = validate_race_data(
+                    self.app_config.race_folder,
+                    self.race_parser.results,
+                    self.config_loader.section_list
+                )
+            validation_errors = self._race_validation_errors + validate_calculation(
+                self.calc_engine,
+                self.config_loader.section_list
             )
             
             if validation_errors:
@@ -1977,41 +2461,35 @@ class MainWindow(QMainWindow):
             self.all_day_widget.set_data(self.calc_engine, self.config_loader)
             self.log("✓ 全日データを表示しました")
             
-            # 既存の日別タブをクリア
-            while len(self.day_widgets) > 0:
-                widget = self.day_widgets.pop()
-                # タブから削除（総合成績と全日の後、インデックス2から）
+            # 日別タブの区間を決定（DAY列に基づく）
+            status_matrix = self.config_loader.build_status_matrix()
+            if status_matrix.by_group:
+                # DAY列がない場合、GROUP列で代替
+                self.log("⚠ DAY列が見つからないため、GROUP列を使用します")
+            day_sections = dict(status_matrix.tabs)
+            
+            # 不要になった日別タブを削除
+            for title in [title for title in self.day_widgets if title not in day_sections]:
+                widget = self.day_widgets.pop(title)
                 tab_index = self.tab_widget.indexOf(widget)
                 if tab_index >= 0:
                     self.tab_widget.removeTab(tab_index)
-            
-            # 日別タブを動的に生成（DAY列に基づく）
-            max_day = self.config_loader.get_max_day()
-            if max_day > 0:
-                for day_idx in range(1, max_day + 1):
-                    sections = self.config_loader.get_sections_by_day(day_idx)
-                    if sections:
-                        widget = ResultTableWidget()
-                        widget.set_data(self.calc_engine, self.config_loader)
-                        widget.set_filter(sections)
-                        self.day_widgets.append(widget)
-                        self.tab_widget.addTab(widget, f"{day_idx}日目")
-                        self.log(f"✓ {day_idx}日目: {len(sections)}区間")
-            else:
-                # DAY列がない場合、GROUP列で代替
-                self.log("⚠ DAY列が見つからないため、GROUP列を使用します")
-                for group_idx in range(1, 10):  # 最大10グループまで試す
-                    sections = self.config_loader.get_sections_by_group(group_idx)
-                    if sections:
-                        widget = ResultTableWidget()
-                        widget.set_data(self.calc_engine, self.config_loader)
-                        widget.set_filter(sections)
-                        self.day_widgets.append(widget)
-                        self.tab_widget.addTab(widget, f"グループ{group_idx}")
-                        self.log(f"✓ グループ{group_idx}: {len(sections)}区間")
-                    elif group_idx > 1 and len(self.day_widgets) > 0:
-                        # 連続してセクションが見つからなくなったら終了
-                        break
+                widget.deleteLater()
+            
+            # 既存の日別タブは使い回し、新しい日のタブだけ追加（描画は表示時）
+            prev_widget = self.all_day_widget
+            for title, sections in day_sections.items():
+                widget = self.day_widgets.get(title)
+                if widget is None:
+                    widget = ResultTableWidget()
+                    self.day_widgets[title] = widget
+                    self.tab_widget.insertTab(self.tab_widget.indexOf(prev_widget) + 1, widget, title)
+                widget.set_deferred_data(self.calc_engine, self.config_loader, sections)
+                prev_widget = widget
+                self.log(f"✓ {title}: {len(sections)}区間")
+            
+            # 日別タブが選択中のままなら描画
+            self._on_tab_changed(self.tab_widget.currentIndex())
             
             # クラス別総合成績タブを追加
             self._update_class_summary_display()
@@ -2024,49 +2502,76 @@ class MainWindow(QMainWindow):
             QMessageBox.critical(self, "エラー", f"結果表示中にエラーが発生しました:\n{str(e)}")
             self.log(f"❌ エラー: {str(e)}")
     
+    def _on_tab_changed(self, index):
+        """タブ切替時: 日別タブは初めて表示されたときに描画"""
+        widget = self.tab_widget.widget(index)
+        if isinstance(widget, ResultTableWidget):
+            widget.ensure_populated()
+    
+    def _on_class_tab_changed(self, index):
+        """クラス別総合成績のサブタブ切替時: クラスのタブは初めて表示されたときに描画"""
+        widget = self.class_tab_widget.widget(index)
+        if isinstance(widget, SummaryTableWidget):
+            widget.ensure_populated()
+    
     def _update_class_summary_display(self):
-        """クラス別総合成績タブを更新"""
-        # 既存のクラス別総合成績タブを削除
-        if self.class_summary_tab is not None:
-            tab_index = self.tab_widget.indexOf(self.class_summary_tab)
-            if tab_index >= 0:
-                self.tab_widget.removeTab(tab_index)
-            self.class_summary_tab = None
-        
-        self.class_summary_widgets.clear()
-        
+        """クラス別総合成績タブを更新（既存のクラスのタブは作り直さずに使い回す）"""
         # すべてのクラスを取得
         classes = self.output_formatter.get_all_classes()
         
         if not classes:
+            # クラス別総合成績タブを削除
+            if self.class_summary_tab is not None:
+                tab_index = self.tab_widget.indexOf(self.class_summary_tab)
+                if tab_index >= 0:
+                    self.tab_widget.removeTab(tab_index)
+                self.class_summary_tab.deleteLater()
+                self.class_summary_tab = None
+                self.class_tab_widget = None
+                self.class_summary_widgets.clear()
             self.log("⚠ クラス情報が見つかりません")
             return
         
-        # クラス別総合成績タブを作成
-        self.class_summary_tab = QWidget()
-        class_summary_layout = QVBoxLayout(self.class_summary_tab)
-        
-        # クラスごとのサブタブを作成
-        class_tab_widget = QTabWidget()
-        
-        # 「全クラス」タブ（全体表示）
-        all_class_widget = SummaryTableWidget()
-        all_class_widget.set_data(self.calc_engine, self.config_loader, self.app_config)
-        class_tab_widget.addTab(all_class_widget, "全クラス")
-        self.class_summary_widgets['全クラス'] = all_class_widget
-        
-        # 各クラスのタブ
-        for class_name in classes:
-            widget = SummaryTableWidget()
-            widget.set_class_data(self.calc_engine, self.config_loader, self.app_config, class_name)
-            class_tab_widget.addTab(widget, class_name)
-            self.class_summary_widgets[class_name] = widget
+        if self.class_summary_tab is None:
+            # クラス別総合成績タブを作成
+            self.class_summary_tab = QWidget()
+            class_summary_layout = QVBoxLayout(self.class_summary_tab)
+            
+            # クラスごとのサブタブを作成（各クラスのタブは初めて表示されたときに描画）
+            self.class_tab_widget = QTabWidget()
+            self.class_tab_widget.currentChanged.connect(self._on_class_tab_changed)
+            class_summary_layout.addWidget(self.class_tab_widget)
+            
+            # 「全クラス」タブ（全体表示）
+            all_class_widget = SummaryTableWidget()
+            self.class_tab_widget.addTab(all_class_widget, "全クラス")
+            self.class_summary_widgets['全クラス'] = all_class_widget
+            
+            # メインタブに追加（総合成績と区間結果の間、インデックス1）
+            self.tab_widget.insertTab(1, self.class_summary_tab, "クラス別総合成績")
+        
+        self.class_summary_widgets['全クラス'].set_data(self.calc_engine, self.config_loader, self.app_config)
+        
+        # 不要になったクラスのタブを削除
+        for class_name in [name for name in self.class_summary_widgets
+                           if name != '全クラス' and name not in classes]:
+            widget = self.class_summary_widgets.pop(class_name)
+            self.class_tab_widget.removeTab(self.class_tab_widget.indexOf(widget))
+            widget.deleteLater()
+        
+        # 各クラスのタブ（既存のタブは使い回し、新しいクラスのタブだけクラス名順の位置に追加）
+        for tab_index, class_name in enumerate(classes, start=1):
+            widget = self.class_summary_widgets.get(class_name)
+            if widget is None:
+                widget = SummaryTableWidget()
+                self.class_tab_widget.insertTab(tab_index, widget, class_name)
+                self.class_summary_widgets[class_name] = widget
+            widget.set_deferred_class_data(self.calc_engine, self.config_loader, self.app_config, class_name,
+                                           self.output_formatter)
             self.log(f"✓ クラス別総合成績: {class_name}")
         
-        class_summary_layout.addWidget(class_tab_widget)
-        
-        # メインタブに追加（総合成績と区間結果の間、インデックス1）
-        self.tab_widget.insertTab(1, self.class_summary_tab, "クラス別総合成績")
+        # クラスのタブが選択中のままなら描画
+        self._on_class_tab_changed(self.class_tab_widget.currentIndex())
         
         self.log(f"✓ クラス別総合成績を表示しました（{len(classes)}クラス）")
     
@@ -2084,17 +2589,31 @@ class MainWindow(QMainWindow):
             return
         
         self.log(f"\nExcel ファイルに出力中: {filename}")
-        
-        try:
-            success = self.output_formatter.export_to_excel(filename)
-            if success:
-                QMessageBox.information(self, "成功", f"Excel ファイルに出力しました:\n{filename}")
-                self.log("✓ Excel 出力完了")
-            else:
-                QMessageBox.critical(self, "エラー", "Excel ファイルの出力に失敗しました")
-        except Exception as e:
-            QMessageBox.critical(self, "エラー", f"Excel 出力中にエラーが発生しました:\n{str(e)}")
-            self.log(f"❌ エラー: {str(e)}")
+        self.flush_log()
+        
+        # 書き出しはワーカースレッドで行い、出力中は再実行できないようにする
+        self.export_excel_btn.setEnabled(False)
+        self.export_excel_action.setEnabled(False)
+        self._excel_export_task = ExportTask(self.output_formatter.export_to_excel, filename)
+        self._excel_export_task.signals.finished.connect(self._on_excel_export_finished)
+        QThreadPool.globalInstance().start(self._excel_export_task)
+    
+    def _on_excel_export_finished(self, success, error_message):
+        """Excel出力完了時の処理（メインスレッドで実行）"""
+        filename = self._excel_export_task.filename
+        self._excel_export_task = None
+        self.export_excel_btn.setEnabled(True)
+        self.export_excel_action.setEnabled(True)
+        
+        if error_message:
+            QMessageBox.critical(self, "エラー", f"Excel 出力中にエラーが発生しました:\n{error_message}")
+            self.log(f"❌ エラー: {error_message}")
+        elif success:
+            QMessageBox.information(self, "成功", f"Excel ファイルに出力しました:\n{filename}")
+            self.log("✓ Excel 出力完了")
+        else:
+            QMessageBox.critical(self, "エラー", "Excel ファイルの出力に失敗しました")
+        self.flush_log()
     
     def export_csv(self):
         """CSV出力"""
@@ -2110,17 +2629,32 @@ class MainWindow(QMainWindow):
             return
         
         self.log(f"\nCSV ファイルに出力中: {filename}")
-        
-        try:
-            success = self.output_formatter.export_to_csv(filename)
-            if success:
-                QMessageBox.information(self, "成功", f"CSV ファイルに出力しました:\n{filename}")
-                self.log("✓ CSV 出力完了")
-            else:
-                QMessageBox.critical(self, "エラー", "CSV ファイルの出力に失敗しました")
-        except Exception as e:
-            QMessageBox.critical(self, "エラー", f"CSV 出力中にエラーが発生しました:\n{str(e)}")
-            self.log(f"❌ エラー: {str(e)}")
+        self.flush_log()
+        
+        # 書き出しはワーカースレッドで行い、出力中は再実行できないようにする
+        self.export_csv_btn.setEnabled(False)
+        self.export_csv_action.setEnabled(False)
+        self._csv_export_task = ExportTask(self.output_formatter.export_to_csv, filename)
+        self._csv_export_task.signals.finished.connect(self._on_csv_export_finished)
+        QThreadPool.globalInstance().start(self._csv_export_task)
+    
+    def _on_csv_export_finished(self, success, error_message):
+        """CSV出力完了時の処理（メインスレッドで実行）"""
+        filename = self._csv_export_task.filename
+        self._csv_export_task = None
+        self.export_csv_btn.setEnabled(True)
+        self.export_csv_action.setEnabled(True)
+        
+        if error_message:
+            QMessageBox.critical(self, "エラー", f"CSV 出力中にエラーが発生しました:\n{error_message}")
+            self.log(f"❌ エラー: {error_message}")
+        elif success:
+            self.statusBar().showMessage(f"CSV ファイルに出力しました: {filename}",
+                                         self.STATUS_MESSAGE_TIMEOUT)
+            self.log("✓ CSV 出力完了")
+        else:
+            QMessageBox.critical(self, "エラー", "CSV ファイルの出力に失敗しました")
+        self.flush_log()
     
     def open_status_matrix(self):
         """区間ステータス設定"""
@@ -2128,7 +2662,15 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "警告", "先に Setting を読み込んでください")
             return
         
-        dialog = StatusMatrixDialog(self, self.app_config, self.config_loader)
+        dialog = self._status_matrix_dialog
+        if dialog is None or dialog.config_loader is not self.config_loader:
+            if dialog is not None:
+                dialog.deleteLater()
+            dialog = StatusMatrixDialog(self, self.app_config, self.config_loader,
+                                        self.config_loader.build_status_matrix())
+            self._status_matrix_dialog = dialog
+        else:
+            dialog.reload(self.app_config)
         dialog.exec()
     
     def open_final_status(self):
@@ -2137,26 +2679,61 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "警告", "先に Setting を読み込んでください")
             return
         
-        dialog = FinalStatusDialog(self, self.app_config, self.config_loader)
+        dialog = self._final_status_dialog
+        if dialog is None or dialog.config_loader is not self.config_loader:
+            if dialog is not None:
+                dialog.deleteLater()
+            dialog = FinalStatusDialog(self, self.app_config, self.config_loader,
+                                       self.config_loader.build_status_matrix())
+            self._final_status_dialog = dialog
+        else:
+            dialog.reload(self.app_config)
         dialog.exec()
     
+    def _schedule_config_save(self):
+        """設定の保存を予約（200ms 以内の変更はまとめて保存）"""
+        self.app_config.mark_dirty()
+        self._save_timer.start()
+    
+    def closeEvent(self, event):
+        """終了時に予約中の設定を保存"""
+        self._save_timer.stop()
+        self.app_config.flush()
+        super().closeEvent(event)
+    
     def set_co_point(self):
         """CO点数設定"""
-        from PySide6.QtWidgets import QInputDialog
-        
         value, ok = QInputDialog.getInt(
             self, "CO点数設定", "CO クリア時の点数:",
             self.app_config.co_point, 0, 10000, 1
         )
         
-        if ok:
+        # 値が変わっていなければ保存しない
+        if ok and value != self.app_config.co_point:
             self.app_config.co_point = value
-            self.app_config.save()
+            self._schedule_config_save()
             self.log(f"✓ CO 点数を {value} に設定しました")
-            QMessageBox.information(self, "成功", f"CO 点数を {value} に設定しました")
+            self.flush_log()
+            self.statusBar().showMessage(f"CO 点数を {value} に設定しました",
+                                         self.STATUS_MESSAGE_TIMEOUT)
     
     def set_folders(self):
         """フォルダ設定"""
+        if self._folders_dialog is None:
+            self._folders_dialog = self._build_folders_dialog()
+        dialog, race_edit, settings_edit = self._folders_dialog
+        
+        # 現在の設定を入力欄に反映してから表示
+        race_edit.setText(self.app_config.race_folder)
+        settings_edit.setText(self.app_config.settings_folder)
+        dialog.exec()
+    
+    def _build_folders_dialog(self):
+        """フォルダ設定ダイアログを構築（初回のみ、以降は使い回す）
+        
+        Returns:
+            (ダイアログ, race フォルダ入力欄, settings フォルダ入力欄)
+        """
         dialog = QDialog(self)
         dialog.setWindowTitle("フォルダ設定")
         dialog.setMinimumWidth(600)
@@ -2166,10 +2743,10 @@ class MainWindow(QMainWindow):
         # フォーム部分
         form_layout = QFormLayout()
         
-        race_edit = QLineEdit(self.app_config.race_folder)
+        race_edit = QLineEdit()
         form_layout.addRow("race フォルダ:", race_edit)
         
-        settings_edit = QLineEdit(self.app_config.settings_folder)
+        settings_edit = QLineEdit()
         form_layout.addRow("settings フォルダ:", settings_edit)
         
         layout.addLayout(form_layout)
@@ -2179,14 +2756,25 @@ class MainWindow(QMainWindow):
         
         save_btn = QPushButton("保存")
         def save():
-            self.app_config.race_folder = race_edit.text()
-            self.app_config.settings_folder = settings_edit.text()
-            self.app_config.save()
-            self.log(f"✓ フォルダ設定を保存しました")
-            self.log(f"  race: {self.app_config.race_folder}")
-            self.log(f"  settings: {self.app_config.settings_folder}")
-            QMessageBox.information(dialog, "成功", "フォルダ設定を保存しました")
+            race_folder = race_edit.text()
+            settings_folder = settings_edit.text()
+            # 変更がなければ保存せずに閉じる
+            if (race_folder == self.app_config.race_folder
+                    and settings_folder == self.app_config.settings_folder):
+                dialog.accept()
+                return
+            
+            self.app_config.race_folder = race_folder
+            self.app_config.settings_folder = settings_folder
+            self._schedule_config_save()
+            self.log("\n".join([
+                "✓ フォルダ設定を保存しました",
+                f"  race: {self.app_config.race_folder}",
+                f"  settings: {self.app_config.settings_folder}",
+            ]))
+            self.flush_log()
             dialog.accept()
+            self.statusBar().showMessage("フォルダ設定を保存しました", self.STATUS_MESSAGE_TIMEOUT)
         
         save_btn.clicked.connect(save)
         button_layout.addWidget(save_btn)
@@ -2243,7 +2831,7 @@ class MainWindow(QMainWindow):
                         
                         # パスを自動的にセット
                         self.app_config.settings_folder = settings_path
-                        self.app_config.save()
+                        self._schedule_config_save()
                         
                         self.log(f"✓ サンプルファイルを生成しました: {settings_path}")
                         self.log(f"✓ settings フォルダのパスを設定しました")
@@ -2270,7 +2858,7 @@ class MainWindow(QMainWindow):
         layout.addWidget(sample_btn)
         
         dialog.setLayout(layout)
-        dialog.exec()
+        return dialog, race_edit, settings_edit
 
 
 def main():
@@ -2281,7 +2869,13 @@ def main():
     app.setStyle("Fusion")
     
     # デフォルトフォント設定（MS Sans Serifエラー回避）
-    default_font = QFont("Yu Gothic UI", 9)
+    # フォントDBを起動時に一度だけ引き、未インストール環境では代替フォント探索をさせない
+    default_font = app.font()
+    if QFontDatabase.hasFamily("Yu Gothic UI"):
+        default_font.setFamily("Yu Gothic UI")
+    default_font.setPointSize(9)
+    # ログの ✓/❌/⚠ 等は Yu Gothic UI にないためフォントマージは残し、描画品質優先を指定
+    default_font.setStyleStrategy(QFont.PreferQuality)
     app.setFont(default_font)
     
     window = MainWindow()
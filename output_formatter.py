@@ -3,6 +3,9 @@
 Excel/CSV ファイルへの出力機能
 """
 
+import os
+import importlib.util
+import numpy as np
 import pandas as pd
 from typing import List
 from calculation_engine import CalculationEngine
@@ -12,65 +15,98 @@ from config_loader import ConfigLoader
 class OutputFormatter:
     """出力フォーマッタークラス"""
     
+    # CSV 書き出し時のファイルバッファサイズ（128KB）
+    CSV_BUFFER_SIZE = 1 << 17
+    # CSV 書き出し時に一度に文字列化・書き込みする行数
+    CSV_CHUNK_ROWS = 10_000
+    
+    # xlsxwriter（requirements.txt に記載）で、行を逐次ファイルへ書き出す constant_memory モードで Excel を出力する
+    # （古い環境などでインストールされていなければ openpyxl を使う）
+    USE_XLSXWRITER = importlib.util.find_spec('xlsxwriter') is not None
+    # openpyxl で出力する場合、このセル数以上ならブック全体をメモリに持たない write_only モードを使う
+    EXCEL_WRITE_ONLY_THRESHOLD = 100_000
+    
     def __init__(self, calc_engine: CalculationEngine, config_loader: ConfigLoader):
         self.calc = calc_engine
         self.config = config_loader
+        # クラス別サマリーのキャッシュ: クラス名 → DataFrame（計算結果の版が変わったら破棄）
+        self._class_summary_cache = {}
+        self._class_summary_version = None
+        # 順位付け前の全ゼッケンのサマリー行（計算結果の版が変わったら作り直す）
+        self._summary_rows_cache = None
+        self._summary_rows_version = None
+        # 設定から求める区間順・車両クラス一覧（初回使用時に作成し、invalidate() まで使い回す）
+        self._sections = None
+        self._classes = None
+    
+    def invalidate(self):
+        """設定を読み直した場合などに、設定・計算結果から作ったキャッシュをすべて破棄"""
+        self._class_summary_cache = {}
+        self._class_summary_version = None
+        self._summary_rows_cache = None
+        self._summary_rows_version = None
+        self._sections = None
+        self._classes = None
+    
+    def _get_sections(self) -> tuple:
+        """section ファイルの並び順の区間名（キャッシュ）"""
+        if self._sections is None:
+            self._sections = tuple(self.config.get_section_order())
+        return self._sections
     
     def create_dataframe(self) -> pd.DataFrame:
         """結果を DataFrame に変換"""
         # ゼッケン一覧を取得（昇順）
-        zekkens = sorted(self.calc.results.keys())
+        results = self.calc.results
+        zekkens = sorted(results.keys())
         
-        # 区間一覧を section の順序で取得
-        sections = self.config.get_section_order()
+        # 区間一覧を section の順序で取得し、列名と順位を表示するか（PC/PCG のみ）を区間ごとに一度だけ求める
+        sections = [
+            (section,
+             f'{section}_通過時間', f'{section}_差分', f'{section}_順位', f'{section}_得点',
+             self.calc._get_section_type(section) in ['PC', 'PCG'])
+            for section in self._get_sections()
+        ]
         
         # データを格納するリスト
         rows = []
         
         for zekken in zekkens:
             row_data = {'ゼッケン': zekken}
+            zekken_results = results[zekken]
             
-            for section in sections:
-                if section not in self.calc.results[zekken]:
+            for section, time_col, diff_col, rank_col, point_col, has_rank in sections:
+                result = zekken_results.get(section)
+                if result is None:
                     # データがない場合
-                    row_data[f'{section}_通過時間'] = 'ー'
-                    row_data[f'{section}_差分'] = 'ー'
-                    row_data[f'{section}_順位'] = 'ー'
-                    row_data[f'{section}_得点'] = 0
+                    row_data[time_col] = 'ー'
+                    row_data[diff_col] = 'ー'
+                    row_data[rank_col] = 'ー'
+                    row_data[point_col] = 0
                     continue
                 
-                result = self.calc.results[zekken][section]
+                if result.status and result.status != "N.C.":
+                    # RIT, BLNKの場合: タイム表示無し
+                    row_data[time_col] = result.status
+                    row_data[diff_col] = result.status
+                    row_data[rank_col] = result.status
+                    row_data[point_col] = 0
+                    continue
                 
-                # ステータスがある場合
                 if result.status:
-                    if result.status == "N.C.":
-                        # N.C.の場合: タイム表示あり、差分算出、順位は除外
-                        row_data[f'{section}_通過時間'] = self.calc.format_time(result.passage_time) if result.passage_time else 'ー'
-                        row_data[f'{section}_差分'] = self.calc.format_diff(result.diff) if result.diff is not None else 'ー'
-                        row_data[f'{section}_順位'] = result.status
-                        row_data[f'{section}_得点'] = result.point
-                    else:
-                        # RIT, BLNKの場合: タイム表示無し
-                        row_data[f'{section}_通過時間'] = result.status
-                        row_data[f'{section}_差分'] = result.status
-                        row_data[f'{section}_順位'] = result.status
-                        row_data[f'{section}_得点'] = 0
+                    # N.C.の場合: タイム表示あり、差分算出、順位は除外
+                    passage_str = result.passage_str if result.passage_time else 'ー'
+                    rank = result.status
                 else:
-                    # 通過時間
-                    row_data[f'{section}_通過時間'] = self.calc.format_time(result.passage_time)
-                    
-                    # 差分
-                    row_data[f'{section}_差分'] = self.calc.format_diff(result.diff)
-                    
+                    passage_str = result.passage_str
                     # 順位（PC/PCG のみ）
-                    section_type = self.calc._get_section_type(section)
-                    if section_type in ['PC', 'PCG'] and result.rank:
-                        row_data[f'{section}_順位'] = result.rank
-                    else:
-                        row_data[f'{section}_順位'] = 'ー'
-                    
-                    # 得点
-                    row_data[f'{section}_得点'] = result.point
+                    rank = result.rank if has_rank and result.rank else 'ー'
+                
+                # 通過時間・差分・順位・得点
+                row_data[time_col] = passage_str
+                row_data[diff_col] = result.diff_str
+                row_data[rank_col] = rank
+                row_data[point_col] = result.point
             
             # 総合得点
             row_data['総合得点'] = self.calc.get_total_score(zekken)
@@ -85,6 +121,14 @@ class OutputFormatter:
         try:
             df = self.create_dataframe()
             
+            if self.USE_XLSXWRITER:
+                self._write_excel_constant_memory(df, filename, '結果')
+                return True
+            
+            if df.size >= self.EXCEL_WRITE_ONLY_THRESHOLD:
+                self._write_excel_write_only(df, filename, '結果')
+                return True
+            
             # Excel ライターを作成
             with pd.ExcelWriter(filename, engine='openpyxl') as writer:
                 df.to_excel(writer, sheet_name='結果', index=False)
@@ -95,15 +139,80 @@ class OutputFormatter:
             print(f"Excel 出力エラー: {e}")
             return False
     
+    @staticmethod
+    def _write_excel_constant_memory(df: pd.DataFrame, filename: str, sheet_name: str):
+        """xlsxwriter の constant_memory モードで DataFrame を 1 シートに書き出す
+        
+        constant_memory モードでは書き終えた行がメモリから破棄され、前の行には戻れない。
+        pandas の to_excel は列順にセルを書くため使えず、ヘッダーから 1 行ずつ順に書き込む。
+        """
+        import xlsxwriter
+        
+        workbook = xlsxwriter.Workbook(filename, {'constant_memory': True})
+        try:
+            worksheet = workbook.add_worksheet(sheet_name)
+            # pandas のヘッダー書式（太字・罫線・中央揃え）に合わせる
+            header_format = workbook.add_format(
+                {'bold': True, 'border': 1, 'align': 'center', 'valign': 'top'})
+            worksheet.write_row(0, 0, [str(col) for col in df.columns], header_format)
+            
+            # 欠損値は空セルにする
+            values = df.astype(object).where(df.notna(), None).to_numpy().tolist()
+            for row_idx, row in enumerate(values, start=1):
+                worksheet.write_row(row_idx, 0, row)
+        finally:
+            workbook.close()
+    
+    @staticmethod
+    def _write_excel_write_only(df: pd.DataFrame, filename: str, sheet_name: str):
+        """openpyxl の write_only モードで DataFrame を 1 シートに書き出す
+        
+        行を追加した順にファイルへ書き出されるため、セル数が多くてもメモリ使用量がほぼ一定になる。
+        """
+        from openpyxl import Workbook
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.styles import Alignment, Border, Font, Side
+        
+        workbook = Workbook(write_only=True)
+        worksheet = workbook.create_sheet(sheet_name)
+        
+        # pandas のヘッダー書式（太字・罫線・中央揃え）に合わせる（書式は全セルで共有）
+        header_font = Font(bold=True)
+        thin = Side(style='thin')
+        header_border = Border(left=thin, right=thin, top=thin, bottom=thin)
+        header_alignment = Alignment(horizontal='center', vertical='top')
+        header_cells = []
+        for col in df.columns:
+            cell = WriteOnlyCell(worksheet, value=str(col))
+            cell.font = header_font
+            cell.border = header_border
+            cell.alignment = header_alignment
+            header_cells.append(cell)
+        worksheet.append(header_cells)
+        
+        # 欠損値は空セルにする
+        for row in df.astype(object).where(df.notna(), None).to_numpy().tolist():
+            worksheet.append(row)
+        
+        workbook.save(filename)
+    
     def export_to_csv(self, filename: str = "result.csv") -> bool:
         """CSV ファイルに出力"""
+        tmp_file = filename + ".tmp"
         try:
             df = self.create_dataframe()
-            df.to_csv(filename, index=False, encoding='utf-8-sig')
+            # 大きめのバッファを持つ一時ファイルへ pandas が CSV_CHUNK_ROWS 行ずつ書き出し、
+            # 書き終えてから置き換えることで失敗時に既存の出力ファイルを壊さない
+            with open(tmp_file, 'w', newline='', encoding='utf-8-sig',
+                      buffering=self.CSV_BUFFER_SIZE) as f:
+                df.to_csv(f, index=False, chunksize=self.CSV_CHUNK_ROWS)
+            os.replace(tmp_file, filename)
             return True
         
         except Exception as e:
             print(f"CSV 出力エラー: {e}")
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
             return False
     
     def get_summary_dataframe(self) -> pd.DataFrame:
@@ -122,6 +231,17 @@ class OutputFormatter:
         - Penalty(-) (ペナルティ点数)
         - TotalPoint (H.C.L. Point - Penalty)
         """
+        return self._rank_summary(self._build_summary_rows())
+    
+    def _build_summary_rows(self) -> pd.DataFrame:
+        """全ゼッケンのサマリー行（順位付け前）の DataFrame を作成
+        
+        得点計算は計算結果の版ごとに一度だけ行い、総合・クラス別のサマリーで共用する。
+        返す DataFrame はキャッシュそのものなので、呼び出し側で変更しないこと。
+        """
+        if self._summary_rows_version == self.calc.version and self._summary_rows_cache is not None:
+            return self._summary_rows_cache
+        
         # ゼッケンと総合得点のリストを作成
         data = []
         
@@ -160,107 +280,77 @@ class OutputFormatter:
                 'TotalPoint': total_point  # 後で更新される
             })
         
-        # DataFrame 作成
-        df = pd.DataFrame(data)
-        
-        # ステータスがないものを得点順にソート（TotalPointで）
-        normal_df = df[df['Result'].isna()].copy()
-        normal_df = normal_df.sort_values('H.C.L Point', ascending=False)
-        normal_df['Result'] = range(1, len(normal_df) + 1)
+        self._summary_rows_cache = pd.DataFrame(data)
+        self._summary_rows_version = self.calc.version
+        return self._summary_rows_cache
+    
+    @staticmethod
+    def _rank_summary(df: pd.DataFrame) -> pd.DataFrame:
+        """サマリー行に順位を付ける（ステータスのある行は順位付けから除外して末尾に置く）
         
-        # ステータスがあるものと結合
-        status_df = df[~df['Result'].isna()]
+        DataFrame を分割・結合せず、並び順を行位置の配列で求めて一度だけ並べ替える。
+        """
+        has_status = df['Result'].notna().to_numpy()
         
-        result_df = pd.concat([normal_df, status_df], ignore_index=True)
+        # ステータスがないものを得点順にソート（TotalPointで）、ステータスがあるものはその後ろに元の順で置く
+        points = df['H.C.L Point'].reset_index(drop=True)
+        normal_order = points[~has_status].sort_values(ascending=False).index.to_numpy()
+        status_order = np.flatnonzero(has_status)
+        result_df = df.take(np.concatenate([normal_order, status_order])).reset_index(drop=True)
         
-        # 後方互換性のため、'No' を 'ゼッケン'、'Result' を '順位' としても参照できるようにする
-        # ResultTableWidget (main_pyside6.py の line 994, 996) は 'ゼッケン' と '順位' 列を使用している
-        # 将来的には ResultTableWidget を 'No' と 'Result' 列を使用するように変更することを推奨
-        result_df['ゼッケン'] = result_df['No']
-        result_df['順位'] = result_df['Result']
+        # ステータスがないものに 1 から順位を付ける
+        ranks = result_df['Result'].to_numpy(dtype=object, copy=True)
+        ranks[:len(normal_order)] = range(1, len(normal_order) + 1)
+        result_df['Result'] = pd.Series(ranks, index=result_df.index, dtype=object)
         
         return result_df
     
     def get_all_classes(self) -> List[str]:
         """すべての車両クラスを取得（重複なし、ソート済み）"""
-        classes = set()
-        for entry in self.config.entries_dict.values():
-            car_class = entry.get('CarClass', '')
-            if car_class:
-                classes.add(car_class)
-        return sorted(list(classes))
+        if self._classes is None:
+            classes = set()
+            for entry in self.config.entries_dict.values():
+                car_class = entry.get('CarClass', '')
+                if car_class:
+                    classes.add(car_class)
+            self._classes = tuple(sorted(classes))
+        return list(self._classes)
     
     def get_summary_by_class(self, class_name: str) -> pd.DataFrame:
         """クラス別の総合順位DataFrame を作成
         
+        同じ計算結果に対してはクラスごとに一度だけ作成し、以降はキャッシュの複製を返す。
+        
         Args:
             class_name: 車両クラス名
         
         Returns:
             クラスに属するゼッケンのみの DataFrame（クラス内順位付け）
         """
-        # まず全体のサマリーデータを取得
-        all_data = []
+        if self._class_summary_version != self.calc.version:
+            self._class_summary_cache = {}
+            self._class_summary_version = self.calc.version
         
-        for zekken in sorted(self.calc.results.keys()):
-            # entries 情報取得
-            entry = self.config.entries_dict.get(zekken, {})
-            
-            # クラスフィルタリング
-            if entry.get('CarClass', '') != class_name:
-                continue
-            
-            # 得点計算
-            pure_score = self.calc.get_pure_score(zekken)
-            hcl_score = self.calc.get_hcl_score(zekken)
-            
-            # ペナルティ取得
-            penalty = 0  # デフォルト値、実際の値は後でAppConfigから取得される
-            
-            # TotalPoint計算
-            total_point = hcl_score - penalty
-            
-            # 最終結果ステータスを確認
-            if zekken in self.calc.final_status:
-                status = self.calc.final_status[zekken]
-                rank = status  # ステータスを順位として記録
-            else:
-                rank = None
-            
-            all_data.append({
-                'Result': rank,  # 順位（後で計算）
-                'No': zekken,
-                'DriverName': entry.get('DriverName', ''),
-                'CoDriverName': entry.get('CoDriverName', ''),
-                'CarName': entry.get('CarName', ''),
-                '車両製造年': entry.get('CarYear', ''),
-                'CarClass': entry.get('CarClass', ''),
-                'Point': pure_score,
-                'H.C.L Point': hcl_score,
-                'Penalty(-)': penalty,  # 後で更新される
-                'TotalPoint': total_point  # 後で更新される
-            })
+        summary_df = self._class_summary_cache.get(class_name)
+        if summary_df is None:
+            summary_df = self._create_summary_by_class(class_name)
+            self._class_summary_cache[class_name] = summary_df
         
-        # DataFrame 作成
-        df = pd.DataFrame(all_data)
+        return summary_df.copy()
+    
+    def _create_summary_by_class(self, class_name: str) -> pd.DataFrame:
+        """クラス別の総合順位DataFrame を作成（キャッシュなし）"""
+        # 全体のサマリー行からクラスに属する行だけを取り出す
+        all_rows = self._build_summary_rows()
+        if all_rows.empty:
+            return pd.DataFrame()
         
+        df = all_rows[all_rows['CarClass'] == class_name]
         if df.empty:
-            return df
+            return pd.DataFrame()
         
-        # ステータスがないものをクラス内で得点順にソート
-        normal_df = df[df['Result'].isna()].copy()
-        normal_df = normal_df.sort_values('H.C.L Point', ascending=False)
-        normal_df['Result'] = range(1, len(normal_df) + 1)
+        # 列の型は全クラス混在の値から推定されているため、クラス内の値で推定し直す
+        df = df.infer_objects()
         
-        # ステータスがあるものと結合
-        status_df = df[~df['Result'].isna()]
-        
-        result_df = pd.concat([normal_df, status_df], ignore_index=True)
-        
-        # 後方互換性のため、'No' を 'ゼッケン'、'Result' を '順位' としても参照できるようにする
-        # ResultTableWidget (main_pyside6.py の line 994, 996) は 'ゼッケン' と '順位' 列を使用している
-        # 将来的には ResultTableWidget を 'No' と 'Result' 列を使用するように変更することを推奨
-        result_df['ゼッケン'] = result_df['No']
-        result_df['順位'] = result_df['Result']
-        
-        return result_df
+        # クラス内で得点順に順位付け
+        return self._rank_summary(df)
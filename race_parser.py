@@ -6,9 +6,9 @@ race フォルダ内のすべての CSV ファイルを読み込み、START/GOAL
 import os
 import glob
 import pandas as pd
-from datetime import datetime, timedelta
-from typing import Dict, Tuple, List
+from typing import Dict, Tuple, List, Optional
 import re
+from concurrent.futures import ThreadPoolExecutor
 from logging_config import get_logger
 
 # ロガー取得
@@ -26,13 +26,27 @@ class RaceResult:
 class RaceParser:
     """race CSV ファイル解析クラス"""
     
+    # ファイル読み込みを並列に行うスレッド数の上限（読み込みは I/O 待ちが中心のため）
+    PARSE_MAX_WORKERS = 6
+    
+    # 時刻文字列の形式（datetime.strptime の "%H:%M:%S.%f" / "%H:%M:%S" と同じ範囲を受け付ける）
+    TIME_PATTERN = re.compile(r'(2[0-3]|[0-1]\d|\d):([0-5]\d|\d):([0-5]\d|\d)(?:\.(\d{1,6}))?')
+    
+    # ファイル名の各部分（区間名 + START/GOAL）の形式（例: PC1START）
+    FILENAME_PART_PATTERN = re.compile(r'([A-Z]+\d+)(START|GOAL)')
+    
     def __init__(self, race_folder: str = "race"):
         self.race_folder = race_folder
         # start_time[ゼッケン][区間名] = 時刻文字列
         self.start_time = {}
         # goal_time[ゼッケン][区間名] = 時刻文字列
         self.goal_time = {}
+        # 通過時間計算用: _start_us[(ゼッケン, 区間名)] = 0時からのマイクロ秒（時刻が不正な場合は None）
+        self._start_us: Dict[Tuple[int, str], Optional[int]] = {}
+        self._goal_us: Dict[Tuple[int, str], Optional[int]] = {}
         self._results_cache = None  # 検証用結果のキャッシュ
+        # 時刻文字列 → 0時からのマイクロ秒（同じ時刻文字列は何度も引かれるため、一度だけパースする）
+        self._parsed_time_cache: Dict[str, int] = {}
         logger.info(f"RaceParser初期化: フォルダ={race_folder}")
     
     @property
@@ -76,10 +90,14 @@ class RaceParser:
         if len(csv_files) == 0:
             return False, "race フォルダに CSV ファイルが見つかりません"
         
-        for csv_file in csv_files:
-            success, msg = self._parse_file(csv_file)
-            if not success:
-                return False, f"{os.path.basename(csv_file)}: {msg}"
+        # ファイルの読み込みはスレッドプールで並列に行い、
+        # 時刻の記録はファイル順に行う（後のファイルの時刻で上書きされる動作を変えないため）
+        with ThreadPoolExecutor(max_workers=min(self.PARSE_MAX_WORKERS, len(csv_files))) as executor:
+            parsed_files = executor.map(self._parse_file, csv_files)
+            for csv_file, (success, msg, records) in zip(csv_files, parsed_files):
+                self._store_records(records)
+                if not success:
+                    return False, f"{os.path.basename(csv_file)}: {msg}"
         
         return True, f"{len(csv_files)}件のファイルを解析しました"
     
@@ -103,7 +121,7 @@ class RaceParser:
         
         for part in parts:
             # 区間名とSTART/GOALを分離
-            match = re.match(r'([A-Z]+\d+)(START|GOAL)', part)
+            match = self.FILENAME_PART_PATTERN.match(part)
             if match:
                 section = match.group(1)
                 timing = match.group(2)
@@ -111,50 +129,58 @@ class RaceParser:
         
         return results
     
-    def _parse_file(self, filepath: str) -> Tuple[bool, str]:
+    def _parse_file(self, filepath: str) -> Tuple[bool, str, List[Tuple[int, str, str, str]]]:
         """1つの CSV ファイルを解析
         
+        ワーカースレッドから呼ばれるため、インスタンスの状態は変更せずに時刻の記録を返す。
+        
         Args:
             filepath: CSV ファイルパス
         
         Returns:
-            (成功: bool, エラーメッセージ: str)
+            (成功: bool, エラーメッセージ: str, [(ゼッケン, 区間名, START/GOAL, 時刻文字列), ...])
+            失敗した場合も、失敗するまでに読み取った記録を返す
         """
+        records = []
         try:
             # ファイル名から区間情報を取得
             section_info = self._parse_filename(filepath)
             if len(section_info) == 0:
-                return True, ""  # 無視
+                return True, "", records  # 無視
             
-            # CSV 読み込み
-            df = pd.read_csv(filepath, encoding='utf-8-sig')
+            # 列名だけを先に読み込む
+            columns = pd.read_csv(filepath, encoding='utf-8-sig', nrows=0).columns
             
             # time 列を探す
             time_col_idx = None
-            for idx, col in enumerate(df.columns):
+            for idx, col in enumerate(columns):
                 if 'time' in col.lower():
                     time_col_idx = idx
                     break
             
             if time_col_idx is None:
-                return False, "time 列が見つかりません"
-            
-            time_col = df.columns[time_col_idx]
+                return False, "time 列が見つかりません", records
             
             # number 列は time の右側
-            if time_col_idx + 1 >= len(df.columns):
-                return False, "number 列が見つかりません（time 列の右側にありません）"
+            if time_col_idx + 1 >= len(columns):
+                return False, "number 列が見つかりません（time 列の右側にありません）", records
             
-            number_col = df.columns[time_col_idx + 1]
+            # CSV 読み込み（使うのは time 列と number 列だけなので、その 2 列を文字列のまま読み込む）
+            df = pd.read_csv(filepath, encoding='utf-8-sig', engine='c',
+                             usecols=[time_col_idx, time_col_idx + 1], dtype=str)
             
-            # ゼッケンごとに時刻を抽出
+            # ゼッケンごとに時刻を抽出（行ごとに Series を作らないよう、列を配列で取り出して走査）
+            # 時刻の前後の空白は列全体でまとめて取り除いておく
             zekken_found = {}
+            times = df.iloc[:, 0].str.strip().to_numpy()
+            numbers = df.iloc[:, 1].to_numpy()
+            # ループ内で毎回参照する関数はローカル変数に束縛しておく
+            isna = pd.isna
+            append_record = records.append
             
-            for _, row in df.iterrows():
-                number = row[number_col]
-                
+            for number, time_val in zip(numbers, times):
                 # number が空でない行のみ処理
-                if pd.isna(number) or number == '':
+                if isna(number) or number == '':
                     continue
                 
                 try:
@@ -164,30 +190,46 @@ class RaceParser:
                 
                 # 同一ファイル内で同じゼッケンが複数回出現
                 if zekken in zekken_found:
-                    return False, f"ゼッケン {zekken} が複数回出現しています"
+                    return False, f"ゼッケン {zekken} が複数回出現しています", records
                 
-                time_val = row[time_col]
-                if pd.isna(time_val):
+                if isna(time_val):
                     continue
                 
-                time_str = str(time_val).strip()
+                time_str = time_val
                 zekken_found[zekken] = time_str
                 
                 # 各区間情報に対して時刻を記録
                 for section_name, timing_type in section_info:
-                    if timing_type == 'START':
-                        if zekken not in self.start_time:
-                            self.start_time[zekken] = {}
-                        self.start_time[zekken][section_name] = time_str
-                    elif timing_type == 'GOAL':
-                        if zekken not in self.goal_time:
-                            self.goal_time[zekken] = {}
-                        self.goal_time[zekken][section_name] = time_str
+                    append_record((zekken, section_name, timing_type, time_str))
             
-            return True, ""
+            return True, "", records
         
         except Exception as e:
-            return False, f"ファイル解析エラー: {str(e)}"
+            return False, f"ファイル解析エラー: {str(e)}", records
+    
+    def _store_records(self, records: List[Tuple[int, str, str, str]]):
+        """_parse_file() が返した時刻の記録を start_time / goal_time に反映
+        
+        通過時間の計算で引く時刻は、(ゼッケン, 区間名) をキーにした平坦な辞書にパース済みの値でも保持する。
+        """
+        # ループ内で毎回参照する属性はローカル変数に束縛しておく（同じ辞書なので書き戻しは不要）
+        start_time = self.start_time
+        goal_time = self.goal_time
+        start_us = self._start_us
+        goal_us = self._goal_us
+        parse_time = self._parse_time_or_none
+        
+        for zekken, section_name, timing_type, time_str in records:
+            if timing_type == 'START':
+                if zekken not in start_time:
+                    start_time[zekken] = {}
+                start_time[zekken][section_name] = time_str
+                start_us[(zekken, section_name)] = parse_time(time_str)
+            elif timing_type == 'GOAL':
+                if zekken not in goal_time:
+                    goal_time[zekken] = {}
+                goal_time[zekken][section_name] = time_str
+                goal_us[(zekken, section_name)] = parse_time(time_str)
     
     def get_passage_time(self, zekken: int, section: str) -> Tuple[bool, float]:
         """指定されたゼッケンと区間の通過時間（秒）を取得
@@ -199,62 +241,49 @@ class RaceParser:
         Returns:
             (データあり: bool, 通過時間: float)
         """
-        # START と GOAL がそろっているか確認
-        if zekken not in self.start_time or section not in self.start_time[zekken]:
-            return False, 0.0
-        if zekken not in self.goal_time or section not in self.goal_time[zekken]:
-            return False, 0.0
-        
-        start_str = self.start_time[zekken][section]
-        goal_str = self.goal_time[zekken][section]
-        
-        try:
-            # 時刻文字列をパース
-            start_dt = self._parse_time(start_str)
-            goal_dt = self._parse_time(goal_str)
-            
-            # 差分を計算（秒）
-            diff = (goal_dt - start_dt).total_seconds()
-            
-            # 日をまたいだ場合の処理
-            if diff < 0:
-                diff += 24 * 3600
-            
-            return True, diff
-        
-        except Exception:
-            return False, 0.0
+        return self._get_passage_time((zekken, section), (zekken, section))
     
-    def _parse_time(self, time_str: str) -> datetime:
-        """時刻文字列を datetime にパース
+    def _parse_time(self, time_str: str) -> int:
+        """時刻文字列を 0時からのマイクロ秒にパース
+        
+        datetime.strptime を使わずに整数で計算する。マイクロ秒の整数で差を取ってから
+        1,000,000 で割るため、timedelta.total_seconds() と同じ値になる。
         
         Args:
-            time_str: 時刻文字列（例: "14:27:56.28"）
+            time_str: 時刻文字列（例: "14:27:56.28"、小数部は省略可）
         
         Returns:
-            datetime オブジェクト
+            0時からのマイクロ秒
         """
-        # 複数のフォーマットに対応
-        formats = [
-            "%H:%M:%S.%f",
-            "%H:%M:%S",
-        ]
-        
-        for fmt in formats:
-            try:
-                return datetime.strptime(time_str, fmt)
-            except ValueError:
-                continue
-        
-        raise ValueError(f"時刻フォーマットが不正です: {time_str}")
+        parsed = self._parsed_time_cache.get(time_str)
+        if parsed is not None:
+            return parsed
+        
+        match = self.TIME_PATTERN.fullmatch(time_str)
+        if match is None:
+            raise ValueError(f"時刻フォーマットが不正です: {time_str}")
+        
+        hours, minutes, seconds, fraction = match.groups()
+        # 小数部は %f と同様に右側を 0 で埋めて 6 桁（マイクロ秒）として扱う
+        microseconds = int(fraction.ljust(6, '0')) if fraction else 0
+        parsed = ((int(hours) * 60 + int(minutes)) * 60 + int(seconds)) * 1_000_000 + microseconds
+        self._parsed_time_cache[time_str] = parsed
+        return parsed
+    
+    def _parse_time_or_none(self, time_str: str) -> Optional[int]:
+        """時刻文字列を 0時からのマイクロ秒にパース（不正な場合は None）"""
+        try:
+            return self._parse_time(time_str)
+        except ValueError:
+            return None
     
     def has_start(self, zekken: int, section: str) -> bool:
         """START 時刻があるか"""
-        return zekken in self.start_time and section in self.start_time[zekken]
+        return (zekken, section) in self._start_us
     
     def has_goal(self, zekken: int, section: str) -> bool:
         """GOAL 時刻があるか"""
-        return zekken in self.goal_time and section in self.goal_time[zekken]
+        return (zekken, section) in self._goal_us
     
     def get_all_zekkens(self) -> set:
         """すべてのゼッケン番号を取得"""
@@ -275,28 +304,21 @@ class RaceParser:
         Returns:
             (データあり: bool, 通過時間: float)
         """
-        # START と GOAL がそろっているか確認
-        if zekken not in self.start_time or start_section not in self.start_time[zekken]:
-            return False, 0.0
-        if zekken not in self.goal_time or goal_section not in self.goal_time[zekken]:
+        return self._get_passage_time((zekken, start_section), (zekken, goal_section))
+    
+    def _get_passage_time(self, start_key: Tuple[int, str], goal_key: Tuple[int, str]) -> Tuple[bool, float]:
+        """START 時刻と GOAL 時刻の (ゼッケン, 区間名) から通過時間（秒）を取得"""
+        # START と GOAL がそろっているか確認（時刻が不正な場合もデータなしとする）
+        start_us = self._start_us.get(start_key)
+        goal_us = self._goal_us.get(goal_key)
+        if start_us is None or goal_us is None:
             return False, 0.0
         
-        start_str = self.start_time[zekken][start_section]
-        goal_str = self.goal_time[zekken][goal_section]
+        # 差分を計算（秒）
+        diff = (goal_us - start_us) / 1_000_000
         
-        try:
-            # 時刻文字列をパース
-            start_dt = self._parse_time(start_str)
-            goal_dt = self._parse_time(goal_str)
-            
-            # 差分を計算（秒）
-            diff = (goal_dt - start_dt).total_seconds()
-            
-            # 日をまたいだ場合の処理
-            if diff < 0:
-                diff += 24 * 3600
-            
-            return True, diff
+        # 日をまたいだ場合の処理
+        if diff < 0:
+            diff += 24 * 3600
         
-        except Exception:
-            return False, 0.0
+        return True, diff
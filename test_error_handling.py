@@ -1,134 +1,207 @@
 #!/usr/bin/env python3
 """
-Test script for new error handling features
-Demonstrates the ValidationError class and error confirmation workflow
+Tests for the error handling features
+Covers the ValidationError class and the error confirmation workflow
+
+The settings, race data and calculation results are loaded once per module by
+module-scoped fixtures and shared by all tests (run with ``pytest -s`` to see the report).
+The initial validation errors are rebuilt for each test, because tests confirm them.
 """
 
+import sys
+from collections import Counter
+
+import pytest
+
 from config_loader import ConfigLoader
 from race_parser import RaceParser
 from calculation_engine import CalculationEngine
 from data_validator import validate_all, ValidationError
 
-print("=" * 60)
-print("Error Handling Feature Test")
-print("=" * 60)
-
-# Load settings
-print("\n1. Loading settings...")
-config_loader = ConfigLoader('sample/setting')
-success, msg = config_loader.load_all()
-print(f"   Result: {msg}")
-
-# Load race data
-print("\n2. Loading race data...")
-race_parser = RaceParser('sample/race')
-success, msg = race_parser.parse_all()
-print(f"   Result: {msg}")
-
-# Initial validation (without calc_engine)
-print("\n3. Running initial validation...")
-errors = validate_all('sample/race', race_parser.results, config_loader.section_list)
-print(f"   Found {len(errors)} errors")
-
-# Show error type breakdown
-error_types = {}
-for err in errors:
-    error_types[err.error_type] = error_types.get(err.error_type, 0) + 1
-
-print("\n   Error breakdown:")
-for err_type, count in sorted(error_types.items()):
-    type_names = {
-        "csv_duplicate": "CSVファイル名重複",
-        "zekken_duplicate": "ゼッケン重複",
-        "section_order": "区間通過順",
-        "zekken_order": "ゼッケン通過順",
-        "invalid_status": "ステータス不正",
-        "measurement_type": "計測タイプ",
-        "measurement_deficiency": "計測データ不備"
-    }
-    print(f"     {type_names.get(err_type, err_type)}: {count}")
-
-# Test error confirmation workflow
-print("\n4. Testing error confirmation workflow...")
-if errors:
+# Expected number of measurement deficiency errors for the sample data
+_EXPECTED_MEASUREMENT_DEFICIENCY = 0
+
+# Display names for the error types
+_TYPE_NAMES = {
+    "csv_duplicate": "CSVファイル名重複",
+    "zekken_duplicate": "ゼッケン重複",
+    "section_order": "区間通過順",
+    "zekken_order": "ゼッケン通過順",
+    "invalid_status": "ステータス不正",
+    "measurement_type": "計測タイプ",
+    "measurement_deficiency": "計測データ不備"
+}
+
+
+@pytest.fixture(scope="module")
+def loaded():
+    """Load settings and race data once (steps 1-2)"""
+    print("\n1. Loading settings...")
+    config_loader = ConfigLoader('sample/setting')
+    success, msg = config_loader.load_all()
+    print(f"   Result: {msg}")
+    assert success, msg
+
+    print("\n2. Loading race data...")
+    race_parser = RaceParser('sample/race')
+    success, msg = race_parser.parse_all()
+    print(f"   Result: {msg}")
+    assert success, msg
+
+    return config_loader, race_parser
+
+
+@pytest.fixture
+def errors(loaded):
+    """Initial validation without calc_engine (step 3)
+
+    Function-scoped so that errors confirmed by one test do not leak into another.
+    """
+    config_loader, race_parser = loaded
+    print("\n3. Running initial validation...")
+    errors = validate_all('sample/race', race_parser.results, config_loader.section_list)
+    print(f"   Found {len(errors)} errors")
+    return errors
+
+
+@pytest.fixture(scope="module")
+def calc_engine(loaded):
+    """Run calculation for the measurement deficiency check (step 7)"""
+    config_loader, race_parser = loaded
+    print("\n7. Running calculation for measurement deficiency check...")
+    calc_engine = CalculationEngine(config_loader, race_parser, co_point=500)
+    calc_engine.calculate_all()
+    print("   Calculation complete")
+    return calc_engine
+
+
+@pytest.fixture(scope="module")
+def errors_with_calc(loaded, calc_engine):
+    """Re-validation with calculation results (step 8)"""
+    config_loader, race_parser = loaded
+    print("\n8. Re-validating with calculation results...")
+    return validate_all(
+        'sample/race',
+        race_parser.results,
+        config_loader.section_list,
+        calc_engine
+    )
+
+
+def test_error_breakdown(errors):
+    """Show error type breakdown"""
+    assert all(isinstance(err, ValidationError) for err in errors)
+
+    error_types = Counter(err.error_type for err in errors)
+
+    # Collect the lines of the loop below and write them in one go
+    out = ["\n   Error breakdown:\n"]
+    for err_type, count in sorted(error_types.items()):
+        out.append(f"     {_TYPE_NAMES.get(err_type, err_type)}: {count}\n")
+    sys.stdout.write("".join(out))
+
+    assert sum(error_types.values()) == len(errors)
+
+
+def test_error_confirmation_workflow(errors):
+    """Test error confirmation workflow (step 4)"""
+    print("\n4. Testing error confirmation workflow...")
+    if not errors:
+        pytest.skip("no validation errors in the sample data")
+
     test_error = errors[0]
     print(f"   Test error type: {test_error.error_type}")
     print(f"   Allows confirmation: {test_error.allow_confirmation}")
     print(f"   Initially confirmed: {test_error.confirmed}")
-    
+
     # Try to confirm it
     if test_error.allow_confirmation:
         test_error.confirmed = True
         print(f"   After confirmation: {test_error.confirmed}")
         print(f"   Comparison key: {test_error.get_comparison_key()}")
+        assert test_error.confirmed
     else:
         print(f"   Cannot confirm this error (critical)")
 
-# Test error persistence using comparison keys
-print("\n5. Testing error persistence (same error detection)...")
-confirmed_errors_map = {}
-for error in errors[:10]:  # Confirm first 10 errors
-    if error.allow_confirmation:
-        error.confirmed = True
-        confirmed_errors_map[error.get_comparison_key()] = True
-
-print(f"   Stored {len(confirmed_errors_map)} confirmed error keys")
-
-# Simulate re-validation
-print("\n6. Simulating re-validation after changes...")
-new_errors = validate_all('sample/race', race_parser.results, config_loader.section_list)
-
-# Restore confirmed status
-restored_count = 0
-for error in new_errors:
-    error_key = error.get_comparison_key()
-    if error_key in confirmed_errors_map:
-        error.confirmed = True
-        restored_count += 1
-
-print(f"   Restored confirmed status for {restored_count} errors")
-
-# Count unconfirmed errors
-unconfirmed_count = sum(1 for err in new_errors if not err.confirmed)
-print(f"   Unconfirmed errors: {unconfirmed_count}/{len(new_errors)}")
-
-# Run calculation and check for measurement deficiency errors
-print("\n7. Running calculation for measurement deficiency check...")
-calc_engine = CalculationEngine(config_loader, race_parser, co_point=500)
-calc_engine.calculate_all()
-print("   Calculation complete")
-
-# Re-run validation with calc_engine
-print("\n8. Re-validating with calculation results...")
-errors_with_calc = validate_all(
-    'sample/race',
-    race_parser.results,
-    config_loader.section_list,
-    calc_engine
-)
-
-# Check for new errors
-new_error_types = {}
-for err in errors_with_calc:
-    new_error_types[err.error_type] = new_error_types.get(err.error_type, 0) + 1
-
-print(f"   Total errors after calculation: {len(errors_with_calc)}")
-if 'measurement_deficiency' in new_error_types:
-    print(f"   Measurement deficiency errors: {new_error_types['measurement_deficiency']}")
-else:
-    print("   No measurement deficiency errors found")
-
-# Show sample of each error type
-print("\n9. Sample errors by type:")
-shown_types = set()
-for error in errors_with_calc[:50]:
-    if error.error_type not in shown_types:
+
+def test_error_persistence(loaded, errors):
+    """Test error persistence using comparison keys (steps 5-6)"""
+    print("\n5. Testing error persistence (same error detection)...")
+    confirmed_keys = set()
+    for error in errors[:10]:  # Confirm first 10 errors
+        if error.allow_confirmation:
+            error.confirmed = True
+            confirmed_keys.add(error.get_comparison_key())
+
+    print(f"   Stored {len(confirmed_keys)} confirmed error keys")
+
+    # Simulate re-validation (a real run, so the comparison keys must stay stable across runs)
+    print("\n6. Simulating re-validation after changes...")
+    config_loader, race_parser = loaded
+    new_errors = validate_all('sample/race', race_parser.results, config_loader.section_list)
+    assert not any(err.confirmed for err in new_errors)
+
+    # Restore confirmed status
+    restored_count = 0
+    for error in new_errors:
+        error_key = error.get_comparison_key()
+        if error_key in confirmed_keys:
+            error.confirmed = True
+            restored_count += 1
+
+    print(f"   Restored confirmed status for {restored_count} errors")
+
+    # Count unconfirmed errors
+    unconfirmed_count = sum(1 for err in new_errors if not err.confirmed)
+    print(f"   Unconfirmed errors: {unconfirmed_count}/{len(new_errors)}")
+
+    # Every confirmed key is found again after re-validation
+    assert {err.get_comparison_key() for err in new_errors if err.confirmed} == confirmed_keys
+    assert restored_count + unconfirmed_count == len(new_errors)
+
+
+def test_measurement_deficiency(errors, errors_with_calc):
+    """Check for measurement deficiency errors after calculation"""
+    new_error_types = Counter(err.error_type for err in errors_with_calc)
+
+    print(f"   Total errors after calculation: {len(errors_with_calc)}")
+    if 'measurement_deficiency' in new_error_types:
+        print(f"   Measurement deficiency errors: {new_error_types['measurement_deficiency']}")
+    else:
+        print("   No measurement deficiency errors found")
+
+    assert new_error_types['measurement_deficiency'] == _EXPECTED_MEASUREMENT_DEFICIENCY
+
+    # Errors found before calculation (in particular those that cannot be confirmed)
+    # are still reported after it
+    keys_after = {err.get_comparison_key() for err in errors_with_calc}
+    critical_keys = {err.get_comparison_key() for err in errors if not err.allow_confirmation}
+    assert critical_keys <= keys_after
+    assert {err.get_comparison_key() for err in errors} <= keys_after
+
+
+def test_sample_errors_by_type(errors_with_calc):
+    """Show sample of each error type (step 9)"""
+    new_error_types = Counter(err.error_type for err in errors_with_calc)
+
+    out = ["\n9. Sample errors by type:\n"]
+    shown_types = set()
+    for error in errors_with_calc:
+        if error.error_type in shown_types:
+            continue
         shown_types.add(error.error_type)
-        lines = str(error).split('\n')
-        print(f"\n   [{error.error_type}]")
-        print(f"   {lines[0]}")
-        print(f"   Allow confirmation: {error.allow_confirmation}")
-
-print("\n" + "=" * 60)
-print("✓ All error handling features tested successfully!")
-print("=" * 60)
+        first_line = str(error).partition('\n')[0]
+        out.append(f"\n   [{error.error_type}]\n")
+        out.append(f"   {first_line}\n")
+        out.append(f"   Allow confirmation: {error.allow_confirmation}\n")
+        # Stop once every error type has been shown
+        if len(shown_types) == len(new_error_types):
+            break
+    sys.stdout.write("".join(out))
+
+    # Every error type is shown once
+    assert shown_types == set(new_error_types)
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-s", "-q"]))